@@ -5,13 +5,14 @@ from gents.timeseries import TSCollection
 class GenTSConfig:
     hf_include_patterns = ["*.nc"]
     hf_exclude_patterns = ["*.log"]
+    hf_exclude_dirs = ()
 
     def __init__(self, input_dir, output_dir):
         self._input_dir = input_dir
         self._output_dir = output_dir
 
     def get_hfcollection(self, num_cores, slice_size_years=10, slice_start_year=None, align_method="midpoint"):
-        hfc = HFCollection(self._input_dir , num_processes=num_cores)
+        hfc = HFCollection(self._input_dir , num_processes=num_cores, hf_exclude_dirs=self.hf_exclude_dirs)
         hfc = hfc.include(self.hf_include_patterns).exclude(self.hf_exclude_patterns)
         hfc = hfc.slice_groups(
             slice_size_years=slice_size_years,
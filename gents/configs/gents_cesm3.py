@@ -1,6 +1,5 @@
 from gents.configs.config import GenTSConfig
 from gents.hfcollection import HFCollection
-from gents.timeseries import TSCollection
 
 
 class CESM3Config(GenTSConfig):
@@ -22,9 +21,13 @@ class CESM3Config(GenTSConfig):
         "*cam.i.*",
         "*.static.*"
     ]
+    hf_exclude_dirs = (
+        "rest",
+        "logs"
+    )
 
     def get_hfcollection(self, num_cores, slice_size_years=10, slice_start_year=None, align_method="midpoint"):
-        hfc = HFCollection(self._input_dir, num_processes=num_cores)
+        hfc = HFCollection(self._input_dir, num_processes=num_cores, hf_exclude_dirs=self.hf_exclude_dirs)
         hfc = hfc.include(self.hf_include_patterns).exclude(self.hf_exclude_patterns)
         hfc = hfc.slice_groups(
             slice_size_years=slice_size_years,
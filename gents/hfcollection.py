@@ -6,18 +6,18 @@ Developer: Cameron Cummins
 Contact: cameron.cummins@utexas.edu
 Last Header Update: 04/30/25
 """
-from gents.meta import get_meta_from_path
-from gents.utils import ProgressBar, LOG_LEVEL_IO_WARNING
-from cftime import num2date
+from gents.meta import get_metas_from_paths
+from gents.utils import ProgressBar, LOG_LEVEL_IO_WARNING, get_relative_path
 from pathlib import Path
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import defaultdict
 import numpy as np
+import heapq
 import os
+import re
 import fnmatch
-import cftime
 import warnings
 import logging
-import copy
 
 logging.captureWarnings(True)
 logger = logging.getLogger(__name__)
@@ -56,31 +56,56 @@ def get_default_config():
     }
 
 
-def find_files(head_path, pattern):
+def find_files(head_path, pattern, exclude_dirs=None):
     """
     Recursively searches a directory tree for files matching a glob pattern.
 
     Walks ``head_path`` with ``os.walk`` and collects every file whose name
-    matches ``pattern`` via ``fnmatch``.
+    matches ``pattern`` via ``fnmatch``.  Directories whose name appears in
+    ``exclude_dirs`` are pruned from the walk in place, so their subtrees are
+    never listed.
 
     :param head_path: Root directory to begin the recursive search from.
     :type head_path: str or pathlib.Path
     :param pattern: ``fnmatch``-style wildcard pattern to match file names
         against (e.g. ``'*.nc'``).
     :type pattern: str
+    :param exclude_dirs: Directory names to skip during the walk (e.g.
+        ``['rest', 'logs']``). Defaults to ``None`` (no pruning).
+    :type exclude_dirs: list[str] or tuple[str] or None
     :returns: Sorted list of matching file paths.
     :rtype: list[pathlib.Path]
     """
     matched_files = []
+    exclude_dirs = frozenset(exclude_dirs) if exclude_dirs else frozenset()
 
     for root, dirs, files in os.walk(head_path):
-        for file in files:
-            if fnmatch.fnmatch(file, pattern):
-                matched_files.append(Path(os.path.join(root, file)))
+        if exclude_dirs:
+            dirs[:] = [directory for directory in dirs if directory not in exclude_dirs]
+        for file in fnmatch.filter(files, pattern):
+            matched_files.append(Path(os.path.join(root, file)))
 
     return sorted(matched_files)
 
 
+def compile_glob_patterns(glob_patterns):
+    """
+    Compiles one or more glob patterns into a single regular expression.
+
+    The returned pattern matches a string if it matches *any* of the globs,
+    following the same rules as ``fnmatch.fnmatch``, so a path can be tested
+    against every pattern with a single ``match`` call.
+
+    :param glob_patterns: ``fnmatch``-style glob patterns to combine.
+    :type glob_patterns: list[str]
+    :returns: Compiled pattern; matches nothing if ``glob_patterns`` is empty.
+    :rtype: re.Pattern
+    """
+    if len(glob_patterns) == 0:
+        return re.compile("(?!)")
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in glob_patterns))
+
+
 def calculate_year_slices(slice_size_years, min_year, max_year):
     """
     Computes non-overlapping year-range tuples covering a given span.
@@ -148,11 +173,16 @@ def sort_hf_groups(hf_paths, delimiter=".", substring_index=2):
 
     Files are first grouped by their parent directory, then within each
     directory by a common filename prefix derived by dropping the last
-    ``substring_index`` ``delimiter``-delimited tokens from each filename.
+    ``substring_index`` ``delimiter``-delimited tokens from each filename with a
+    single ``str.rsplit`` call.
 
     For example, ``model.h0.0001-01.nc`` and ``model.h0.0001-02.nc`` share
     the prefix ``model.h0`` and end up in the same group.
 
+    Filenames with ``substring_index`` or fewer tokens (too few delimiters to
+    drop that many) are grouped by their first token, or by the whole name if it
+    has no delimiter, so ``foo.nc`` forms the group ``foo*``.
+
     :param hf_paths: List of history file paths to group.
     :type hf_paths: list[pathlib.Path]
     :param delimiter: Token delimiter used to parse the filename prefix.
@@ -165,27 +195,18 @@ def sort_hf_groups(hf_paths, delimiter=".", substring_index=2):
         to lists of matching file paths.
     :rtype: dict[str, list[pathlib.Path]]
     """
-    directory_groups = {}
+    directory_groups = defaultdict(list)
     for path in hf_paths:
-        if path.parent in directory_groups:
-            directory_groups[path.parent].append(path)
-        else:
-            directory_groups[path.parent]= [path]
+        directory_groups[path.parent].append(path)
 
     hf_groups = {}
     for parent_path in directory_groups:
-        group_paths = [path for path in directory_groups[parent_path]]
-        substrings = []
-        for path in group_paths:
-            parsed = path.name[:find_all_indices(path.name, delimiter)[-1 * substring_index]]
-            substrings.append(parsed)
+        substring_groups = defaultdict(list)
+        for path in directory_groups[parent_path]:
+            substring_groups[path.name.rsplit(delimiter, substring_index)[0]].append(path)
         
-        for substring in np.unique(substrings):
-            hf_groups[f"{parent_path}/{substring}*"] = []
-            for path in group_paths:
-                parsed = path.name[:find_all_indices(path.name, delimiter)[-1 * substring_index]]
-                if substring == parsed:
-                    hf_groups[f"{parent_path}/{substring}*"].append(path)
+        for substring in sorted(substring_groups):
+            hf_groups[f"{parent_path}/{substring}*"] = substring_groups[substring]
         
     return hf_groups
 
@@ -195,7 +216,10 @@ def get_year_bounds(hf_to_meta_map):
     Determines the minimum and maximum year covered by a set of history files.
 
     Uses the midpoint of each time bound (or the time value itself if no bounds
-    are present) to determine which year each file belongs to.
+    are present) to determine which year each file belongs to.  The bounds of
+    all files are gathered into a single array so the midpoints are computed in
+    one vectorised pass, and only the earliest and latest midpoints are
+    converted to years.
 
     :param hf_to_meta_map: Dictionary mapping file paths to their
         :class:`~gents.meta.netCDFMeta` objects.
@@ -203,26 +227,20 @@ def get_year_bounds(hf_to_meta_map):
     :returns: Tuple of ``(min_year, max_year)`` as integers.
     :rtype: tuple[int, int]
     """
-    min_year = np.inf
-    max_year = -np.inf
-    
+    time_bounds = []
     for path in list(hf_to_meta_map.keys()):
-        time_bounds = hf_to_meta_map[path].get_cftime_bounds()
-        if time_bounds is None:
-            time_bounds = []
-            for ts in hf_to_meta_map[path].get_cftimes():
-                time_bounds.append([ts, ts])
-        
-        for index in range(len(time_bounds)):
-            lower_bound, upper_bound = time_bounds[index]
-            
-            mid_time = lower_bound + ((upper_bound - lower_bound) / 2)
+        hf_bounds = hf_to_meta_map[path].get_cftime_bounds()
+        if hf_bounds is None:
+            hf_times = np.atleast_1d(np.asarray(hf_to_meta_map[path].get_cftimes()))
+            hf_bounds = np.stack([hf_times, hf_times], axis=1)
+        time_bounds.append(np.reshape(np.asarray(hf_bounds), (-1, 2)))
+
+    if len(time_bounds) == 0:
+        return np.inf, -np.inf
 
-            if mid_time.year > max_year:
-                max_year = mid_time.year
-            if mid_time.year < min_year:
-                min_year = mid_time.year
-    return min_year, max_year
+    time_bounds = np.concatenate(time_bounds)
+    mid_times = time_bounds[:, 0] + ((time_bounds[:, 1] - time_bounds[:, 0]) / 2)
+    return min(mid_times).year, max(mid_times).year
 
 
 def generate_output_template(hf_head_dir, group_path_id, output_head_dir=None, directory_swaps={"hist": "tseries"}, filename_delimiter=".", cutoff_index=None):
@@ -261,16 +279,14 @@ def generate_output_template(hf_head_dir, group_path_id, output_head_dir=None, d
         cutoff_index = find_all_indices(raw_filename_prefix, ".")[-1]
     filename_prefix = raw_filename_prefix[:cutoff_index]
     
-    sub_dir_structure = (str(group_path_id.parent).split(hf_head_dir)[-1]).split("/")
+    sub_dir_structure = list(Path(get_relative_path(group_path_id.parent, hf_head_dir)).parts)
 
     for key in directory_swaps:
         for index in range(len(sub_dir_structure)):
             if sub_dir_structure[index] == key:
                 sub_dir_structure[index] = directory_swaps[key]
 
-    sub_dir_path = "/"
-    for directory in sub_dir_structure:
-        sub_dir_path += f"{directory}/"
+    sub_dir_path = "/" + "".join(f"{directory}/" for directory in sub_dir_structure)
 
     if output_head_dir is None:
         output_template = Path(f"{hf_head_dir}/{sub_dir_path}/{filename_prefix}")
@@ -324,15 +340,9 @@ def filter_by_variables(meta_datasets):
         the same variable set.
     :rtype: tuple[list, list or None]
     """
-    variable_sets = {}
+    variable_sets = defaultdict(list)
     for index in range(len(meta_datasets)):
-        var_set = meta_datasets[index].get_variables()
-        var_set.sort()
-
-        if str(var_set) in variable_sets:
-            variable_sets[str(var_set)].append(index)
-        else:
-            variable_sets[str(var_set)] = [index]
+        variable_sets[tuple(sorted(meta_datasets[index].get_variables()))].append(index)
 
     majority = None
     others = None
@@ -345,11 +355,12 @@ def filter_by_variables(meta_datasets):
         majority_index = np.argmax(counts)
         if np.sum(counts[majority_index] == np.array(counts)) == 1:
             majority_set = list(variable_sets)[majority_index]
+            majority_indices = set(variable_sets[majority_set])
     
             majority = []
             others = []
             for index in range(len(meta_datasets)):
-                if index in variable_sets[majority_set]:
+                if index in majority_indices:
                     majority.append(meta_datasets[index])
                 else:
                     others.append(meta_datasets[index])
@@ -363,28 +374,15 @@ def sort_metas_by_time(metas):
     """
     Returns a new list of metadata objects sorted by their first CFTime value.
 
-    Performs an insertion sort; the original list is not modified.
+    The sort is stable, so files sharing a first time value keep their input
+    order; the original list is not modified.
 
     :param metas: Unsorted list of metadata objects.
     :type metas: list[gents.meta.netCDFMeta]
     :returns: New list sorted in ascending time order.
     :rtype: list[gents.meta.netCDFMeta]
     """
-    time_sorted_metas = [metas[0]]
-
-    if len(metas) > 1:
-        for meta in metas[1:]:
-            meta_sorted = False
-            
-            for index in range(len(time_sorted_metas)):
-                if meta.get_cftimes()[0] < time_sorted_metas[index].get_cftimes()[0]:
-                    time_sorted_metas.insert(index, meta)
-                    meta_sorted = True
-                    break
-            if not meta_sorted:
-                time_sorted_metas.append(meta)
-
-    return time_sorted_metas
+    return sorted(metas, key=lambda meta: meta.get_cftimes()[0])
 
     
 def check_groups_by_variables(sliced_groups):
@@ -452,17 +450,11 @@ def merge_fragmented_groups(hf_groups, hf_meta_map):
         num_fragmented_files = sum([len(fragmented_groups[pattern]) for pattern in fragmented_groups])
         logger.info(f"Found {num_fragmented_files} spatially fragmented files in {len(fragmented_groups)} groups.")
 
-    dim_hashes = {}
+    dim_hashes = defaultdict(list)
     for pattern in fragmented_groups:
         dims = hf_meta_map[fragmented_groups[pattern][0]].get_dim_bounds()
         dims = {variable: dims[variable] for variable in dims if variable != "time"}
-        dims_hash = str(dims)
-
-        if dims_hash not in dim_hashes:
-            dim_hashes[dims_hash] = []
-        
-        for path in fragmented_groups[pattern]:
-            dim_hashes[dims_hash].append(path)
+        dim_hashes[str(dims)].extend(fragmented_groups[pattern])
 
     for dim_hash in dim_hashes:
         paths = dim_hashes[dim_hash]
@@ -484,15 +476,15 @@ class HFCollection:
     new ``HFCollection`` instances, preserving an immutable-style fluent API.
     """
 
-    def __init__(self, hf_dir, num_processes=1, meta_map=None, hf_groups=None, step_map=None, hf_glob_pattern="*.nc*", dask_client=None, multistep_slice_map={}):
+    def __init__(self, hf_dir, num_processes=1, meta_map=None, hf_groups=None, step_map=None, hf_glob_pattern="*.nc*", dask_client=None, multistep_slice_map={}, hf_exclude_dirs=None):
         """
         Initialises the collection by discovering history files under ``hf_dir``.
 
         If ``meta_map`` is not supplied, all discovered files are registered with
         ``None`` metadata (populated later by :meth:`pull_metadata`).  When
         constructing a derived collection via :meth:`copy`, pre-computed maps and
-        groups are passed in directly and the file-discovery log messages are
-        suppressed.
+        groups are passed in directly, so the directory tree is not walked again
+        and the file-discovery log messages are suppressed.
 
         :param hf_dir: Root directory to search for history files.
         :type hf_dir: str
@@ -513,27 +505,32 @@ class HFCollection:
         :param multistep_slice_map: For multi-timestep history files, the map of 
             slice indices to use for groups (mostly internal kwarg).
         :type multistep_slice_map: dict
+        :param hf_exclude_dirs: Directory names pruned from the file search (e.g.
+            ``['rest', 'logs']``). Defaults to ``None`` (search every directory).
+        :type hf_exclude_dirs: list[str] or tuple[str] or None
         :param dask_client: Deprecated. Pass ``num_processes`` instead.
         """
         if dask_client is not None:
             warnings.warn("Dask is no longer implemented in GenTS. Use the 'num_processes' argument to enable parallelism or reference the ReadTheDocs for using Dask..", DeprecationWarning, stacklevel=2)
 
-        self.__raw_paths = find_files(hf_dir, hf_glob_pattern)
         self.__num_processes = num_processes
-
-        if len(self.__raw_paths) == 0:
-            raise FileNotFoundError(f"No files matching '{hf_glob_pattern}' found in '{hf_dir}'")
-
         self.__hf_to_meta_map = {}
         self.__hf_multistep_slices = multistep_slice_map
         if meta_map is None:
+            self.__raw_paths = find_files(hf_dir, hf_glob_pattern, exclude_dirs=hf_exclude_dirs)
+
+            if len(self.__raw_paths) == 0:
+                raise FileNotFoundError(f"No files matching '{hf_glob_pattern}' found in '{hf_dir}'")
+
             for path in self.__raw_paths:
                 self.__hf_to_meta_map[path] = None
         else:
+            self.__raw_paths = list(meta_map.keys())
             self.__hf_to_meta_map = meta_map
         
         self.__hf_groups = hf_groups
         self.__hf_dir = hf_dir
+        self.__pulled = False
 
         if meta_map is None and hf_groups is None:
             logger.info(f"Initialized HFCollection at '{hf_dir}'")
@@ -566,14 +563,16 @@ class HFCollection:
         """
         Returns whether metadata has been loaded for all files in the collection.
 
+        Entries never revert to ``None`` once loaded, so a positive result is
+        cached and later calls (made by every metadata accessor) skip the scan.
+
         :returns: ``True`` if every path has a non-``None`` metadata value,
             ``False`` otherwise.
         :rtype: bool
         """
-        for path in self.__hf_to_meta_map:
-            if self.__hf_to_meta_map[path] is None:
-                return False
-        return True
+        if not self.__pulled:
+            self.__pulled = all(meta is not None for meta in self.__hf_to_meta_map.values())
+        return self.__pulled
 
     
     def get_multistep_slices(self, hf_path):
@@ -686,11 +685,11 @@ class HFCollection:
         """
         Loads metadata for all history files in the collection in parallel.
 
-        Submits :func:`~gents.meta.get_meta_from_path` calls to a
-        ``ProcessPoolExecutor`` worker pool and populates the internal metadata
-        map with the results.  After loading, computes the timestep delta for each
-        group by sorting all CFTime values and taking the interval between the last
-        two steps.
+        Splits the paths into batches (at most 100 files, and roughly four
+        batches per worker) and submits each batch to a ``ProcessPoolExecutor``
+        worker pool via :func:`~gents.meta.get_metas_from_paths`, then populates
+        the internal metadata map with the results.  After loading, computes the timestep delta for each
+        group as the interval between its two latest CFTime values.
 
         :param check_valid: If ``True`` (default), calls :meth:`check_validity`
             after loading to remove files with incomplete or invalid metadata.
@@ -701,22 +700,28 @@ class HFCollection:
         """
         logger.info(f"Pulling metadata...")
         paths = list(self.__hf_to_meta_map.keys())
+        # ProcessPoolExecutor treats max_workers=None as one worker per CPU
+        num_workers = self.__num_processes or os.cpu_count() or 1
+        batch_size = max(1, min(100, int(np.ceil(len(paths) / (4 * num_workers)))))
+        batches = [paths[i:i+batch_size] for i in range(0, len(paths), batch_size)]
 
         with ProcessPoolExecutor(max_workers=self.__num_processes) as executor:
-            futures = {executor.submit(get_meta_from_path, path): path for path in paths}
-            results = []
-            prog_bar = ProgressBar(total=len(futures), label="Pulling Metadata")
+            futures = {executor.submit(get_metas_from_paths, batch): batch for batch in batches}
+            prog_bar = ProgressBar(total=len(paths), label="Pulling Metadata")
             for future in as_completed(futures):
-                path = futures[future]
+                batch = futures[future]
                 try:
-                    result = future.result()
-                    self.__hf_to_meta_map[path] = result
+                    results = future.result()
                 except Exception as exc:
-                    logger.warning(f"Failed to load metadata for {path}: {exc}", exc_info=True)
-                    if raise_errors:
-                        raise
-                finally:
+                    results = [exc for _ in batch]
+                for path, result in zip(batch, results):
                     prog_bar.step()
+                    if isinstance(result, Exception):
+                        logger.warning(f"Failed to load metadata for {path}: {result}", exc_info=result)
+                        if raise_errors:
+                            raise result
+                    else:
+                        self.__hf_to_meta_map[path] = result
 
         if check_valid:
             self.check_validity()
@@ -726,20 +731,21 @@ class HFCollection:
 
         if self.__hf_to_timestep_delta_map is None:
             self.__hf_to_timestep_delta_map = {}
-            for group in self.get_groups():
+            hf_groups = self.get_groups()
+            for group, group_paths in hf_groups.items():
                 times = []
-                for path in self.get_groups()[group]:
+                for path in group_paths:
                     cftimes = self.__hf_to_meta_map[path].get_cftimes()
                     if isinstance(cftimes, (list, np.ndarray)):
                         for ts in cftimes:
                             times.append(ts)
                     else:
                         times.append(cftimes)
-                times = np.sort(times)
                 if len(times) < 2:
-                    raise ValueError(f"Expected time array of size 2 or greater, got {len(times)} for group with paths: {self.get_groups()[group]}")
-                for path in self.get_groups()[group]:
-                    self.__hf_to_timestep_delta_map[path] = times[-1] - times[-2]
+                    raise ValueError(f"Expected time array of size 2 or greater, got {len(times)} for group with paths: {group_paths}")
+                last_time, prior_time = heapq.nlargest(2, times)
+                for path in group_paths:
+                    self.__hf_to_timestep_delta_map[path] = last_time - prior_time
 
     def check_validity(self):
         """
@@ -797,12 +803,11 @@ class HFCollection:
         if type(glob_patterns) is str:
             glob_patterns = [glob_patterns]
 
+        glob_regex = compile_glob_patterns(glob_patterns)
         filtered_path_map = {}
         for path in self.__hf_to_meta_map:
-            for pattern in glob_patterns:
-                if fnmatch.fnmatch(str(path), pattern):
-                    filtered_path_map[path] = self.__hf_to_meta_map[path]
-                    break
+            if glob_regex.match(os.path.normcase(str(path))):
+                filtered_path_map[path] = self.__hf_to_meta_map[path]
         logger.debug(f"Inclusive filter(s) applied: '{glob_patterns}'")
         return self.copy(meta_map=filtered_path_map)
 
@@ -822,14 +827,10 @@ class HFCollection:
         if type(glob_patterns) is str:
             glob_patterns = [glob_patterns]
 
+        glob_regex = compile_glob_patterns(glob_patterns)
         filtered_path_map = {}
         for path in self.__hf_to_meta_map:
-            matches = False
-            for pattern in glob_patterns:
-                if fnmatch.fnmatch(str(path), pattern):
-                    matches = True
-                
-            if not matches:
+            if not glob_regex.match(os.path.normcase(str(path))):
                 filtered_path_map[path] = self.__hf_to_meta_map[path]
         logger.debug(f"Exclusive filter(s) applied: '{glob_patterns}'")
         return self.copy(meta_map=filtered_path_map)
@@ -854,20 +855,19 @@ class HFCollection:
         :rtype: HFCollection
         """
         self.check_pulled()
+        glob_regex = compile_glob_patterns(glob_patterns)
         filtered_path_map = {}
-        remove_paths = []
-        for pattern in glob_patterns:
-            for path in self.__hf_to_meta_map:
-                if fnmatch.fnmatch(path, pattern):
-                    meta_ds = self.__hf_to_meta_map[path]
-                    if meta_ds.get_cftime_bounds() is not None:
-                        time_bnds = meta_ds.get_cftime_bounds()[0]
-                        time = time_bnds[0] + ((time_bnds[1] - time_bnds[0]) / 2)
-                    else:
-                        time = meta_ds.get_cftimes()[0]
-                    
-                    if start_year <= time.year <= end_year:
-                        filtered_path_map[path] = self.__hf_to_meta_map[path]
+        for path in self.__hf_to_meta_map:
+            if glob_regex.match(os.path.normcase(str(path))):
+                meta_ds = self.__hf_to_meta_map[path]
+                if meta_ds.get_cftime_bounds() is not None:
+                    time_bnds = meta_ds.get_cftime_bounds()[0]
+                    time = time_bnds[0] + ((time_bnds[1] - time_bnds[0]) / 2)
+                else:
+                    time = meta_ds.get_cftimes()[0]
+                
+                if start_year <= time.year <= end_year:
+                    filtered_path_map[path] = self.__hf_to_meta_map[path]
 
         logger.debug(f"Filtered from {start_year} to {end_year} applied to following glob patterns: '{glob_patterns}'")
         hf_groups = None
@@ -938,8 +938,7 @@ class HFCollection:
         sliced_groups = {}
         self.check_pulled()
 
-        for group in self.get_groups():
-            hf_paths = self.get_groups()[group]
+        for group, hf_paths in self.get_groups().items():
             if not fnmatch.fnmatch(group, pattern):
                 sliced_groups[group] = hf_paths
                 continue
@@ -957,43 +956,36 @@ class HFCollection:
             
             time_slices = calculate_year_slices(slice_size_years, min_year, max_year)
 
-            hf_slices = {}
+            hf_slices = defaultdict(list)
             variable_set = None
             for hf_path in hf_paths:
                 meta_ds = self.__hf_to_meta_map[hf_path]
 
-                times = []
                 time_bnds = meta_ds.get_cftime_bounds()
                 if time_bnds is None:
-                    times = [meta_ds.get_cftimes()]
+                    times = np.atleast_1d(np.asarray(meta_ds.get_cftimes()))
                 else:
-                    for ts in time_bnds:
-                        if time_alignment_method == "midpoint":
-                            times.append([ts[0] + (ts[1] - ts[0]) / 2])
-                        elif time_alignment_method == "start_bound":
-                            times.append([ts[0]])
-                        elif time_alignment_method == "end_bound":
-                            times.append([ts[1]])
-                        else:
-                            raise ValueError(f"'{time_alignment_method}' is an invalid time-alignment method. Valid methods are ['direct_time', 'midpoint', 'start_bound', 'end_bound']")
-                times = np.concatenate(times)
+                    time_bnds = np.reshape(np.asarray(time_bnds), (-1, 2))
+                    if time_alignment_method == "midpoint":
+                        times = time_bnds[:, 0] + (time_bnds[:, 1] - time_bnds[:, 0]) / 2
+                    elif time_alignment_method == "start_bound":
+                        times = time_bnds[:, 0]
+                    elif time_alignment_method == "end_bound":
+                        times = time_bnds[:, 1]
+                    else:
+                        raise ValueError(f"'{time_alignment_method}' is an invalid time-alignment method. Valid methods are ['direct_time', 'midpoint', 'start_bound', 'end_bound']")
+                # Years are extracted once per file so each slice is matched with array comparisons
+                years = np.array([time.year for time in times])
                 for time_slice in time_slices:
-                    slice_matched = False
-                    for start_index, time in enumerate(times):
-                        if time_slice[0] <= time.year <= time_slice[1]:
-                            slice_matched = True
-                            if time_slice in hf_slices:
-                                hf_slices[time_slice].append(hf_path)
-                            else:
-                                hf_slices[time_slice] = [hf_path]
-                            break
-
-                    if slice_matched:
+                    in_slice = (years >= time_slice[0]) & (years <= time_slice[1])
+                    if in_slice.any():
+                        start_index = int(np.argmax(in_slice))
+                        hf_slices[time_slice].append(hf_path)
+
                         if len(times) > 1:
-                            for end_index, time in enumerate(times):
-                                if time.year > time_slice[1]:
-                                    break
-                            if start_index != 0 or times[-1].year > time_slice[1]:
+                            after_slice = years > time_slice[1]
+                            end_index = int(np.argmax(after_slice)) if after_slice.any() else len(times) - 1
+                            if start_index != 0 or years[-1] > time_slice[1]:
                                 if hf_path in self.__hf_multistep_slices:
                                     assert f"{time_slice[0]}-{time_slice[1]}" not in self.__hf_multistep_slices[hf_path]
                                     self.__hf_multistep_slices[hf_path][f"{time_slice[0]}-{time_slice[1]}"] = (start_index, end_index)
@@ -7,6 +7,7 @@ Contact: cameron.cummins@utexas.edu
 Last Header Update: 07/03/25
 """
 import numpy as np
+import netCDF4 as nc
 from cftime import num2date
 from gents.datastore import GenTSDataStore
 
@@ -53,7 +54,7 @@ def is_var_secondary(variable,
     if variable.name in secondary_vars:
         return True
         
-    dims = np.unique(variable.dimensions)
+    dims = set(variable.dimensions)
 
     for tag in secondary_dims:
         if tag in dims:
@@ -71,11 +72,21 @@ def get_attributes(dataset):
     """
     Extracts all attributes from a netCDF4 dataset or variable into a dictionary.
 
+    ``netCDF4.Dataset`` and ``netCDF4.Variable`` objects (including those
+    wrapped by :class:`~gents.datastore.GenTSDataStore`) expose every attribute
+    through ``__dict__``, which is copied in one call; other objects fall back to
+    reading each attribute named by ``ncattrs()``.
+
     :param dataset: A ``netCDF4.Dataset``, ``netCDF4.MFDataset``, or
         ``netCDF4.Variable`` object from which to read attributes.
     :returns: Dictionary mapping attribute names to their values.
     :rtype: dict
     """
+    if isinstance(dataset, GenTSDataStore):
+        dataset = dataset._ds
+    if type(dataset) in (nc.Dataset, nc.Variable):
+        return dict(dataset.__dict__)
+
     attrs = {}
     for key in dataset.ncattrs():
         attrs[key] = getattr(dataset, key)
@@ -138,13 +149,15 @@ class netCDFMeta:
            :func:`get_time_variables_names`.
         3. Reads and normalises time values (handles scalar, 1-D, and
            higher-dimensional arrays via ``numpy.squeeze``).
-        4. Converts float times to CFTime objects via ``cftime.num2date``.
-        5. If a time-bounds variable exists, reads and converts it (falling back
-           to the time variable's units/calendar if the bounds variable lacks them).
+        4. If a time-bounds variable exists, reads it (falling back to the time
+           variable's units/calendar if the bounds variable lacks them).
+        5. Converts float times and bounds to CFTime objects via
+           ``cftime.num2date``, in a single call when both share units and calendar.
         6. Classifies every variable as primary or secondary via
            :func:`is_var_secondary`.
         7. Records coordinate bounds for each dimension that has an associated
-           coordinate variable.
+           coordinate variable, reusing the time values read in step 3 rather
+           than reading the time coordinate a second time.
 
         :param ds: Open netCDF4 dataset for the history file.
         :type ds: netCDF4.Dataset
@@ -166,23 +179,29 @@ class netCDFMeta:
         if time_eqv is None:
             raise ValueError(f"No equivalent time variable found to concatenate over. Path: {self.__path}")
 
-        self.__time_vals = ds[time_eqv][:]
+        time_var = ds[time_eqv]
+        time_attr_names = time_var.ncattrs()
+        time_data = time_var[:]
+        self.__time_vals = time_data
 
         if len(self.__time_vals.shape) > 1:
             self.__time_vals = np.squeeze(self.__time_vals)
         elif len(self.__time_vals.shape) == 0:
             self.__time_vals = np.array([self.__time_vals])
 
-        if 'calendar' not in ds[time_eqv].ncattrs() or 'units' not in ds[time_eqv].ncattrs():
+        if 'calendar' not in time_attr_names or 'units' not in time_attr_names:
             raise AttributeError(f"Unable to pull 'calendar' and/or 'units' attributes from '{time_eqv}' time-equivalent variable. Path: {self.__path}")
 
-        self.__cftime_vals = num2date(self.__time_vals, units=ds[time_eqv].units, calendar=ds[time_eqv].calendar)
+        time_units, time_calendar = time_var.units, time_var.calendar
 
         self.__time_bounds_vals = None
         self.__cftime_bounds_vals = None
         
-        if time_bnds_eqv:
-            self.__time_bounds_vals = ds[time_bnds_eqv][:]
+        if not time_bnds_eqv:
+            self.__cftime_vals = num2date(self.__time_vals, units=time_units, calendar=time_calendar)
+        else:
+            time_bnds_var = ds[time_bnds_eqv]
+            self.__time_bounds_vals = time_bnds_var[:]
 
             if len(self.__time_bounds_vals.shape) > 2:
                 self.__time_bounds_vals = np.squeeze(self.__time_bounds_vals)
@@ -191,10 +210,22 @@ class netCDFMeta:
             elif len(self.__time_bounds_vals.shape) == 0:
                 raise ValueError(f"Found a 'time_bounds' equivalent variable, but it was a single value. It must have two values (one for each boundary). Path: {self.__path}")
 
-            try:
-                self.__cftime_bounds_vals = num2date(self.__time_bounds_vals, units=ds[time_bnds_eqv].units, calendar=ds[time_bnds_eqv].calendar)
-            except AttributeError:
-                self.__cftime_bounds_vals = num2date(self.__time_bounds_vals, units=ds[time_eqv].units, calendar=ds[time_eqv].calendar)
+            bnds_attr_names = time_bnds_var.ncattrs()
+            if 'units' in bnds_attr_names and 'calendar' in bnds_attr_names:
+                bnds_units, bnds_calendar = time_bnds_var.units, time_bnds_var.calendar
+            else:
+                bnds_units, bnds_calendar = time_units, time_calendar
+
+            if (bnds_units, bnds_calendar) == (time_units, time_calendar):
+                # Shared units and calendar (the common case): parse them once for times and bounds together
+                num_times = self.__time_vals.size
+                cftimes = num2date(np.ma.concatenate([np.ma.ravel(self.__time_vals), np.ma.ravel(self.__time_bounds_vals)]),
+                                   units=time_units, calendar=time_calendar)
+                self.__cftime_vals = cftimes[:num_times].reshape(self.__time_vals.shape)
+                self.__cftime_bounds_vals = cftimes[num_times:].reshape(self.__time_bounds_vals.shape)
+            else:
+                self.__cftime_vals = num2date(self.__time_vals, units=time_units, calendar=time_calendar)
+                self.__cftime_bounds_vals = num2date(self.__time_bounds_vals, units=bnds_units, calendar=bnds_calendar)
         self.__var_names = list(ds.variables)
         self.__primary_var_names = []
         self.__secondary_var_names = []
@@ -202,24 +233,32 @@ class netCDFMeta:
         self.__variable_dims = {}
         self.__variable_dtypes = {}
 
-        for variable in ds.variables:
-            if is_var_secondary(ds[variable]):
+        # Bind each variable handle once; every ds[...] lookup goes through netCDF4's variable table
+        for variable, var in ds.variables.items():
+            if is_var_secondary(var):
                 self.__secondary_var_names.append(variable)
             else:
                 self.__primary_var_names.append(variable)
-            self.__variable_shapes[variable] = ds[variable].shape
-            self.__variable_dims[variable] = ds[variable].dimensions
-            self.__variable_dtypes[variable] = ds[variable].dtype
+            self.__variable_shapes[variable] = var.shape
+            self.__variable_dims[variable] = var.dimensions
+            self.__variable_dtypes[variable] = var.dtype
 
         self.__dim_bounds = {}
 
+        variables = ds.variables
         for dim_variable in ds.dimensions:
-            if dim_variable in ds.variables:
-                dim_data = ds[dim_variable][:]
-                if dim_data.shape[0] >= 2:
-                    self.__dim_bounds[dim_variable] = [np.min(dim_data), np.max(dim_data)]
-                else:
-                    self.__dim_bounds[dim_variable] = [np.min(dim_data)]
+            if dim_variable == time_eqv:
+                # The time coordinate has already been read above
+                dim_data = time_data
+            elif dim_variable in variables:
+                dim_data = variables[dim_variable][:]
+            else:
+                continue
+
+            if dim_data.shape[0] >= 2:
+                self.__dim_bounds[dim_variable] = [np.min(dim_data), np.max(dim_data)]
+            else:
+                self.__dim_bounds[dim_variable] = [np.min(dim_data)]
 
     def get_path(self):
         """
@@ -405,4 +444,28 @@ def get_meta_from_path(path: str):
     except Exception as e:
         raise type(e)(f"{e} Path: {path}") from e
 
-    return ds_meta
\ No newline at end of file
+    return ds_meta
+
+
+def get_metas_from_paths(paths):
+    """
+    Builds :class:`netCDFMeta` objects for a batch of netCDF files.
+
+    Calls :func:`get_meta_from_path` for each path in turn so that a single
+    ``ProcessPoolExecutor`` task can cover many files, amortising the
+    per-task scheduling and pickling overhead.  A failure on one file does not
+    abort the batch; the raised exception is returned in that file's place.
+
+    :param paths: Paths to the netCDF history files.
+    :type paths: list[str]
+    :returns: One entry per path, either the metadata object or the exception
+        raised while reading that file.
+    :rtype: list[netCDFMeta or Exception]
+    """
+    metas = []
+    for path in paths:
+        try:
+            metas.append(get_meta_from_path(path))
+        except Exception as e:
+            metas.append(e)
+    return metas
@@ -1,7 +1,7 @@
 from gents.datastore import GenTSDataStore
 from pathlib import Path
+from collections import defaultdict
 from gents.meta import get_attributes, get_time_variables_names
-from cftime import num2date
 import numpy as np
 
 
@@ -45,7 +45,7 @@ class MHFDataset:
     on :meth:`close` (or ``__exit__``).
     """
 
-    def __init__(self, hf_paths):
+    def __init__(self, hf_paths, in_memory=False):
         """
         Stores the history file paths and initialises empty internal state.
 
@@ -54,39 +54,57 @@ class MHFDataset:
 
         :param hf_paths: Paths to the history files that form this group.
         :type hf_paths: list[str or pathlib.Path]
+        :param in_memory: If ``True``, each history file is read into memory in a
+            single pass when opened (``diskless`` mode) so subsequent reads avoid
+            per-slab disk access. Only suitable when the whole group fits in memory.
+            Defaults to ``False``.
+        :type in_memory: bool
         """
         self.__hf_files = [Path(path) for path in hf_paths]
+        self.__in_memory = in_memory
         self.__hf_datasets = None
         self.__time_mapping = {}
+        self.__time_sub_indices = {}
+        self.__sorted_time_vals = None
         self.__data_coords = None
+        self.__tile_index_ranges = {}
+        self.__cache_checked = set()
+        self.__var_attrs = {}
+        self.__var_dims = {}
+        self.__var_shapes = {}
+        self.__global_attrs = None
 
     def open(self):
         """
         Opens all history file handles and builds the internal time mapping.
 
         Constructs ``__time_mapping``: a dictionary from each unique float time
-        value to the list of file indices that contain it.  Raises an exception if
-        the number of files per time step is not consistent across all time values
-        (i.e. fragmentation is inconsistent).
+        value to the list of file indices that contain it, alongside
+        ``__time_sub_indices`` holding the position of that time value within each
+        of those files, so reads never have to search a file's time array.  Raises
+        an exception if the number of files per time step is not consistent across
+        all time values (i.e. fragmentation is inconsistent).
 
         :raises Exception: If the spatial fragmentation is not consistent over time.
         """
         if self.__hf_datasets is None:
-            self.__hf_datasets = [GenTSDataStore(path, 'r') for path in self.__hf_files]
+            self.__hf_datasets = [GenTSDataStore(path, 'r', diskless=self.__in_memory) for path in self.__hf_files]
+            for hf_data in self.__hf_datasets:
+                hf_data.set_auto_maskandscale(False)
             self.__time_name, self.time_bnds_name = get_time_variables_names(self.__hf_datasets[0])
             self.__time_vals = [np.squeeze(hf_data[self.__time_name][:]) for hf_data in self.__hf_datasets]
 
+            time_mapping = defaultdict(list)
+            time_sub_indices = defaultdict(list)
             for hf_index in range(len(self.__hf_datasets)):
-                time_vals = self.__time_vals[hf_index]
-                if len(time_vals.shape) == 0:
-                    time_vals = [float(time_vals)]
-                
-                for time in time_vals:
-                    time = float(time)
-                    if time in self.__time_mapping:
-                        self.__time_mapping[time].append(hf_index)
-                    else:
-                        self.__time_mapping[time] = [hf_index]
+                time_vals = np.atleast_1d(self.__time_vals[hf_index]).astype(float).tolist()
+
+                for sub_index, time in enumerate(time_vals):
+                    time_mapping[time].append(hf_index)
+                    time_sub_indices[time].append(sub_index)
+            self.__time_mapping = dict(time_mapping)
+            self.__time_sub_indices = dict(time_sub_indices)
+            self.__sorted_time_vals = np.sort(np.array(list(self.__time_mapping.keys())))
             if not self.is_time_consistent():
                 raise Exception("Fragmentation is not consistent over time.")
 
@@ -105,8 +123,9 @@ class MHFDataset:
         :returns: 1-D array of sorted, unique float time values.
         :rtype: numpy.ndarray
         """
-        vals = list(self.__time_mapping.keys())
-        return np.sort(np.array(vals))
+        if self.__sorted_time_vals is None:
+            self.__sorted_time_vals = np.sort(np.array(list(self.__time_mapping.keys())))
+        return self.__sorted_time_vals
 
     def is_time_consistent(self):
         """
@@ -142,13 +161,16 @@ class MHFDataset:
         """
         Returns the dimension names for a variable, read from the first file in the group.
 
+        Dimensions are read once per variable and cached; each call returns a new list.
+
         :param var_name: Name of the variable to inspect.
         :type var_name: str
         :returns: List of dimension name strings in the order they appear on the variable.
         :rtype: list[str]
         """
-        init_ds = self.__hf_datasets[0][var_name]
-        return list(init_ds.dimensions)
+        if var_name not in self.__var_dims:
+            self.__var_dims[var_name] = tuple(self.__hf_datasets[0][var_name].dimensions)
+        return list(self.__var_dims[var_name])
 
     def get_var_dtype(self, var_name):
         """
@@ -165,12 +187,17 @@ class MHFDataset:
         """
         Returns the attribute dictionary for a variable from the first file in the group.
 
+        Attributes are read once per variable and cached; each call returns a new
+        dictionary, so callers may modify it without affecting later outputs.
+
         :param var_name: Name of the variable to inspect.
         :type var_name: str
         :returns: Dictionary mapping attribute names to their values.
         :rtype: dict
         """
-        return get_attributes(self.__hf_datasets[0][var_name])
+        if var_name not in self.__var_attrs:
+            self.__var_attrs[var_name] = get_attributes(self.__hf_datasets[0][var_name])
+        return dict(self.__var_attrs[var_name])
 
     def __check_coord_map(self):
         """
@@ -200,36 +227,40 @@ class MHFDataset:
 
         Accounts for the total number of aggregated time steps and, for fragmented
         groups, the combined spatial extents.  Returns a single-element list for
-        coordinate variables.
+        coordinate variables.  Shapes are computed once per variable and cached;
+        each call returns a new list.
 
         :param var_name: Name of the variable to inspect.
         :type var_name: str
         :returns: List of dimension sizes representing the aggregated output shape.
         :rtype: list[int]
         """
-        self.__check_coord_map()
-        if var_name in self.__data_coords:
-            return [len(self.__data_coords[var_name])]
-        else:
-            init_ds = self.__hf_datasets[0][var_name]
-            dim_shape = []
-            if self.__time_name in init_ds.dimensions:
-                dim_shape.append(len(self.get_time_vals()))
-            dim_shape += [len(self.__data_coords[dim]) for dim in init_ds.dimensions if dim != self.__time_name]
-            return dim_shape
-
-    def get_var_vals(self, var_name, time_index_start=0, time_index_end=None):
+        if var_name not in self.__var_shapes:
+            self.__check_coord_map()
+            if var_name in self.__data_coords:
+                dim_shape = [len(self.__data_coords[var_name])]
+            else:
+                var_dims = self.get_var_dimensions(var_name)
+                dim_shape = []
+                if self.__time_name in var_dims:
+                    dim_shape.append(len(self.get_time_vals()))
+                dim_shape += [len(self.__data_coords[dim]) for dim in var_dims if dim != self.__time_name]
+            self.__var_shapes[var_name] = tuple(dim_shape)
+        return list(self.__var_shapes[var_name])
+
+    def get_var_vals(self, var_name, time_index_start=0, time_index_end=None, out=None):
         """
         Reads and returns a variable's data across the group for a time slice.
 
         Two execution paths are used depending on fragmentation:
 
-        - **Non-fragmented:** iterates over the requested time values and reads
-          each time step from the appropriate single file.
+        - **Non-fragmented:** groups the requested time values into runs of
+          consecutive time steps stored in the same file and reads each run
+          with a single slab read.
         - **Fragmented:** for each time step, reads from all spatial-tile files
           and inserts each tile into the correct slice of a pre-allocated output
-          array by matching tile coordinate values against the combined coordinate
-          map.
+          array.  Tile placement is resolved against the combined coordinate
+          map once per file and reused for every time step.
 
         :param var_name: Name of the variable to read.
         :type var_name: str
@@ -239,8 +270,14 @@ class MHFDataset:
         :param time_index_end: Index of the last time step to include (exclusive).
             Defaults to ``None`` (all remaining time steps).
         :type time_index_end: int or None
+        :param out: Optional pre-allocated array of the output shape and dtype to
+            read time-varying data into, so repeated slab reads can reuse one
+            buffer. Defaults to ``None`` (a new array is allocated).
+        :type out: numpy.ndarray or None
         :returns: Array containing the variable data for the requested time slice.
         :rtype: numpy.ndarray
+        :raises ValueError: If ``out`` does not match the shape or dtype of the
+            requested slice.
         """
         self.__check_coord_map()
         if var_name in self.__data_coords:
@@ -253,62 +290,133 @@ class MHFDataset:
         data_shape = self.get_var_data_shape(var_name)
         data_shape[0] = len(time_vals)
 
-        var_vals = np.empty(data_shape, dtype=self.__hf_datasets[0][var_name].dtype)
+        var_dtype = self.get_var_dtype(var_name)
+        if out is None:
+            var_vals = np.empty(data_shape, dtype=var_dtype)
+        elif list(out.shape) != data_shape or out.dtype != var_dtype:
+            raise ValueError(f"Output buffer for '{var_name}' must have shape {tuple(data_shape)} and dtype {var_dtype}, got shape {out.shape} and dtype {out.dtype}")
+        else:
+            var_vals = out
         if not self.is_fragmented():
-            for index, time_val in enumerate(time_vals):
-                hf_index = self.__time_mapping[time_val][0]
+            run_start = 0
+            while run_start < len(time_vals):
+                hf_index = self.__time_mapping[time_vals[run_start]][0]
+                sub_start = self.__time_sub_indices[time_vals[run_start]][0]
+                run_end = run_start + 1
+                while run_end < len(time_vals) and \
+                        self.__time_mapping[time_vals[run_end]][0] == hf_index and \
+                        self.__time_sub_indices[time_vals[run_end]][0] == sub_start + run_end - run_start:
+                    run_end += 1
                 hf_data = self.__hf_datasets[hf_index]
-                if hf_data[self.__time_name].shape[0] > 1:
-                    sub_t_index = np.where(self.__time_vals[hf_index] == time_val)[0]
-                    var_vals[index] = hf_data[var_name][sub_t_index]
-                else:
-                    var_vals[index] = hf_data[var_name][:]
+                self.__check_chunk_cache(hf_index, var_name)
+                var_vals[run_start:run_end] = hf_data[var_name][sub_start:sub_start + run_end - run_start]
+                run_start = run_end
         else:
             for time_index, time_val in enumerate(time_vals):
-                for hf_index in self.__time_mapping[time_val]:
+                for hf_index, sub_t_index in zip(self.__time_mapping[time_val], self.__time_sub_indices[time_val]):
                     hf_data = self.__hf_datasets[hf_index]
+                    self.__check_chunk_cache(hf_index, var_name)
                     if self.__time_name in hf_data[var_name].dimensions and hf_data[self.__time_name].shape[0] > 1:
-                        sub_t_index = np.where(self.__time_vals[hf_index] == time_val)[0]
                         hf_data_fragment = hf_data[var_name][sub_t_index]
                     else:
                         hf_data_fragment = hf_data[var_name][:]
                     
-                    index_ranges = []
-                    for dim_index, dim in enumerate(hf_data[var_name].dimensions):
-                        if dim == self.__time_name:
-                            index_ranges.append(time_index)
-                        elif dim in hf_data.variables:
-                            dim_vals = hf_data[dim][:]
-                            lower_index = np.where(np.min(dim_vals) == self.__data_coords[dim])[0][0]
-                            upper_index = np.where(np.max(dim_vals) == self.__data_coords[dim])[0][0]
-                            if lower_index == upper_index:
-                                index_ranges.append(lower_index)
-                            else:
-                                index_ranges.append(slice(lower_index, upper_index+1))
-                        elif var_vals.shape[dim_index] == 1:
-                            index_ranges.append(0)
-                        else:
-                            index_ranges.append(slice(0, var_vals.shape[dim_index]))
-                    
-                    var_vals[tuple(index_ranges)] = np.squeeze(hf_data_fragment)
+                    index_ranges = self.__get_tile_index_ranges(hf_index, var_name, var_vals.shape)
+                    index_ranges = tuple(time_index if index is None else index for index in index_ranges)
+                    var_vals[index_ranges] = np.squeeze(hf_data_fragment)
         return var_vals
 
+    def __check_chunk_cache(self, hf_index, var_name):
+        """
+        Ensures a variable's read chunk cache can hold at least two of its chunks.
+
+        Runs of consecutive time steps are read with one slab read per file, but
+        the runs are cut at the caller's slab boundaries, which follow the output
+        chunking rather than the input's.  An input chunk that straddles two slabs
+        is therefore read twice, and fragmented groups read a single time step per
+        tile.  HDF5 bypasses the chunk cache for chunks larger than the cache, so
+        each of those partial reads would re-read and re-decompress the whole
+        chunk.  Each ``(hf_index, var_name)`` pair is sized once, on its first
+        read, and skipped on every later call.
+
+        :param hf_index: Index of the history file within the group.
+        :type hf_index: int
+        :param var_name: Name of the variable about to be read.
+        :type var_name: str
+        """
+        if (hf_index, var_name) in self.__cache_checked:
+            return
+        self.__cache_checked.add((hf_index, var_name))
+
+        var = self.__hf_datasets[hf_index][var_name]
+        chunking = var.chunking()
+        if chunking is None or chunking == "contiguous":
+            return
+        chunk_nbytes = int(np.prod(chunking)) * getattr(var.dtype, "itemsize", 0)
+        cache_size, cache_nelems, cache_preemption = var.get_var_chunk_cache()
+        if cache_size < 2*chunk_nbytes:
+            var.set_var_chunk_cache(size=2*chunk_nbytes, nelems=cache_nelems, preemption=cache_preemption)
+
+    def __get_tile_index_ranges(self, hf_index, var_name, data_shape):
+        """
+        Returns where one spatial tile of a variable sits in the combined output array.
+
+        Tile coordinates are matched against the combined coordinate map once per
+        file and dimension layout, then cached, so per-time-step reads of a
+        fragmented group only index into the output array.
+
+        :param hf_index: Index of the tile's history file within the group.
+        :type hf_index: int
+        :param var_name: Name of the variable being read.
+        :type var_name: str
+        :param data_shape: Shape of the pre-allocated output array.
+        :type data_shape: tuple[int]
+        :returns: One index or slice per variable dimension, with ``None`` in
+            place of the time dimension.
+        :rtype: list
+        """
+        hf_data = self.__hf_datasets[hf_index]
+        var_dims = hf_data[var_name].dimensions
+        key = (hf_index, var_dims, tuple(data_shape[1:]))
+
+        if key not in self.__tile_index_ranges:
+            index_ranges = []
+            for dim_index, dim in enumerate(var_dims):
+                if dim == self.__time_name:
+                    index_ranges.append(None)
+                elif dim in hf_data.variables:
+                    dim_vals = hf_data[dim][:]
+                    lower_index = np.where(np.min(dim_vals) == self.__data_coords[dim])[0][0]
+                    upper_index = np.where(np.max(dim_vals) == self.__data_coords[dim])[0][0]
+                    if lower_index == upper_index:
+                        index_ranges.append(lower_index)
+                    else:
+                        index_ranges.append(slice(lower_index, upper_index+1))
+                elif data_shape[dim_index] == 1:
+                    index_ranges.append(0)
+                else:
+                    index_ranges.append(slice(0, data_shape[dim_index]))
+            self.__tile_index_ranges[key] = index_ranges
+        return self.__tile_index_ranges[key]
+
     def get_global_attrs(self):
         """
         Returns a merged dictionary of global attributes from all files in the group.
 
         Attributes from later files overwrite those from earlier files when keys
-        conflict.
+        conflict.  The merged dictionary is built once and cached for the lifetime
+        of the open group; each call returns a new copy of it.
 
         :returns: Dictionary mapping global attribute names to their values.
         :rtype: dict
         """
         assert self.__hf_datasets is not None
 
-        agg_attrs = {}
-        for ds in self.__hf_datasets:
-            agg_attrs |= get_attributes(ds)
-        return agg_attrs
+        if self.__global_attrs is None:
+            self.__global_attrs = {}
+            for ds in self.__hf_datasets:
+                self.__global_attrs |= get_attributes(ds)
+        return dict(self.__global_attrs)
 
     def __enter__(self):
         self.open()
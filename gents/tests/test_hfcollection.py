@@ -21,6 +21,21 @@ def test_find_files(structured_case):
     assert len(find_files(input_head_dir, "*")) == 1 + num_files
 
 
+def test_find_files_exclude_dirs(structured_case):
+    """find_files() prunes excluded directory names from the walk, skipping every file beneath them."""
+    input_head_dir, output_head_dir = structured_case
+    num_files = STRUCTURED_NUM_VARS*STRUCTURED_NUM_DIRS*STRUCTURED_NUM_SUBDIRS
+    sub_dir = sorted(os.listdir(input_head_dir))[0]
+    num_sub_files = len(find_files(f"{input_head_dir}/{sub_dir}", "*.nc"))
+
+    assert num_sub_files > 0
+    assert len(find_files(input_head_dir, "*.nc", exclude_dirs=[sub_dir])) == num_files - num_sub_files
+    assert len(find_files(input_head_dir, "*.nc", exclude_dirs=[])) == num_files
+
+    hf_collection = HFCollection(input_head_dir, hf_exclude_dirs=[sub_dir])
+    assert len(hf_collection) == num_files - num_sub_files
+
+
 def test_calculate_year_slices():
     """Spot-checks that year slices have correct widths, alignment, and non-overlapping bounds."""
     assert calculate_year_slices(10, 0, 30) == [(0, 9), (10, 19), (20, 29), (30, 39)]
@@ -29,6 +44,42 @@ def test_calculate_year_slices():
     assert calculate_year_slices(5, 3, 12) == [(3, 7), (8, 12)]
 
 
+def test_compile_glob_patterns():
+    """compile_glob_patterns() matches any of its globs like fnmatch, and nothing when empty."""
+    glob_regex = compile_glob_patterns(["*/hist/*.h0.*", "*.h1.*"])
+    assert glob_regex.match("/data/hist/model.h0.0001.nc")
+    assert glob_regex.match("/data/other/model.h1.0001.nc")
+    assert not glob_regex.match("/data/other/model.h0.0001.nc")
+    assert not compile_glob_patterns([]).match("/data/hist/model.h0.0001.nc")
+
+
+def test_generate_output_template():
+    """generate_output_template() mirrors the sub-directory structure, applies swaps, and trims the prefix."""
+    assert generate_output_template("/data", "/data/hist/model.h0.*") == Path("/data/tseries/model.h0")
+    assert generate_output_template("/data/hist", "/data/hist/sub/model.h0*", output_head_dir="/out") == Path("/out/sub/model")
+    assert generate_output_template("/data", "/data/run/data/model.h0.*", output_head_dir="/out") == Path("/out/run/data/model.h0")
+    assert generate_output_template("/data/", "/data/hist/sub/model.h0.*", output_head_dir="/out") == Path("/out/tseries/sub/model.h0")
+
+
+def test_sort_hf_groups_prefix():
+    """sort_hf_groups() strips the requested number of trailing tokens from each filename."""
+    hf_paths = [Path("/data/model.h0.0001-01.nc"), Path("/data/model.h0.0001-02.nc"), Path("/data/model.h1.0001-01.nc")]
+    assert sort_hf_groups(hf_paths) == {
+        "/data/model.h0*": hf_paths[:2],
+        "/data/model.h1*": hf_paths[2:]
+    }
+    assert sort_hf_groups(hf_paths, substring_index=3) == {"/data/model*": hf_paths}
+
+
+def test_sort_hf_groups_few_delimiters():
+    """sort_hf_groups() groups names with too few delimiters by their first token."""
+    hf_paths = [Path("/data/foo.nc"), Path("/data/foo"), Path("/data/bar.h0.nc")]
+    assert sort_hf_groups(hf_paths) == {
+        "/data/bar*": hf_paths[2:],
+        "/data/foo*": hf_paths[:2]
+    }
+
+
 def test_hf_sorting(structured_case):
     """sort_hf_groups() groups files by parent directory and filename prefix; distinct prefixes produce distinct groups."""
     input_head_dir, output_head_dir = structured_case
@@ -160,6 +211,16 @@ def test_time_bounds_case(time_bounds_case):
     assert len(hf_collection) == TIME_NUM_TEST_HIST_FILES
 
 
+def test_pull_metadata_all_cpus(simple_case):
+    """pull_metadata() with num_processes=None uses every CPU and loads all files."""
+    input_head_dir, output_head_dir = simple_case
+    hf_collection = HFCollection(input_head_dir, num_processes=None)
+    hf_collection.pull_metadata()
+
+    assert hf_collection.is_pulled()
+    assert len(hf_collection) == SIMPLE_NUM_TEST_HIST_FILES
+
+
 def test_no_times_case(no_time_case):
     """pull_metadata() raises ValueError when history files have no recognised time variable."""
     input_head_dir, output_head_dir = no_time_case
@@ -179,6 +240,22 @@ def test_scrambled_hfcollection(scrambled_case):
     assert len(hf_collection.check_validity()) == 0
 
 
+def test_check_groups_by_variables(scrambled_case):
+    """check_groups_by_variables() keeps the majority variable set and returns it sorted by time."""
+    input_head_dir, output_head_dir = scrambled_case
+    hf_collection = HFCollection(input_head_dir)
+    hf_collection.pull_metadata()
+
+    metas = [hf_collection[path] for path in hf_collection]
+    variables = list(metas[0].get_variables())
+    filtered_groups = check_groups_by_variables({"group": metas})
+
+    assert len(filtered_groups["group"]) == SCRAMBLED_NUM_TEST_HIST_FILES
+    first_times = [meta.get_cftimes()[0] for meta in filtered_groups["group"]]
+    assert first_times == sorted(first_times)
+    assert metas[0].get_variables() == variables
+
+
 def test_structured_hfcollection(structured_case):
     """HFCollection discovers all files across a multi-directory structure and they all pass validity checks."""
     input_head_dir, output_head_dir = structured_case
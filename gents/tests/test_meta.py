@@ -1,5 +1,5 @@
 from gents.tests.test_cases import *
-from gents.meta import netCDFMeta, is_var_secondary, get_attributes, get_time_variables_names, get_meta_from_path
+from gents.meta import netCDFMeta, is_var_secondary, get_attributes, get_time_variables_names, get_meta_from_path, get_metas_from_paths
 from gents.datastore import GenTSDataStore
 import numpy as np
 import pytest
@@ -15,6 +15,19 @@ def test_get_attributes(tmp_path):
     assert attrs.get("source") == "GenTS testing suite"
 
 
+def test_get_attributes_matches_ncattrs(tmp_path):
+    """get_attributes() returns the same attributes as per-key ncattrs() reads for datasets and variables."""
+    path = str(tmp_path / "test.nc")
+    generate_history_file(path, [15.0], [[0.0, 30.0]])
+    with GenTSDataStore(path, "r") as ds:
+        for obj in [ds, ds["time"], ds["VAR0"]]:
+            expected = {key: obj.getncattr(key) for key in obj.ncattrs()}
+            attrs = get_attributes(obj)
+            assert list(attrs) == list(expected)
+            for key in expected:
+                assert np.array_equal(attrs[key], expected[key])
+
+
 def test_get_time_variables_names_standard(tmp_path):
     """Standard 'time' and 'time_bounds' names are detected correctly."""
     path = str(tmp_path / "test.nc")
@@ -238,3 +251,16 @@ def test_get_meta_from_path_raises_with_path(tmp_path):
     generate_history_file(path, [15.0], None, time_name="nottime")
     with pytest.raises(ValueError, match=str(path)):
         get_meta_from_path(path)
+
+
+def test_get_metas_from_paths(tmp_path):
+    """get_metas_from_paths() returns one entry per path, substituting exceptions for failed files."""
+    good_path = str(tmp_path / "good.nc")
+    bad_path = str(tmp_path / "bad.nc")
+    generate_history_file(good_path, [15.0], [[0.0, 30.0]])
+    generate_history_file(bad_path, [15.0], None, time_name="nottime")
+    metas = get_metas_from_paths([good_path, bad_path])
+    assert len(metas) == 2
+    assert isinstance(metas[0], netCDFMeta)
+    assert metas[0].get_path() == good_path
+    assert isinstance(metas[1], ValueError)
@@ -3,6 +3,7 @@ from gents.mhfdataset import *
 from gents.hfcollection import HFCollection
 from gents.datastore import GenTSDataStore
 import numpy as np
+import netCDF4 as nc
 
 
 def test_MHFDataset_simple(simple_case):
@@ -24,6 +25,96 @@ def test_MHFDataset_simple(simple_case):
             assert np.array_equal(var1_t0_output, np.ones(var1_t0_output.shape))
 
 
+def test_MHFDataset_in_memory(simple_case):
+    """MHFDataset opened in memory returns the same values as when read from disk."""
+    input_head_dir, output_head_dir = simple_case
+    hf_collection = HFCollection(input_head_dir)
+    hf_groups = hf_collection.get_groups()
+
+    for group in hf_groups:
+        with MHFDataset(hf_groups[group]) as agg_hf_ds:
+            disk_vals = agg_hf_ds.get_var_vals("VAR0")
+        with MHFDataset(hf_groups[group], in_memory=True) as agg_hf_ds:
+            assert np.array_equal(agg_hf_ds.get_var_vals("VAR0"), disk_vals)
+
+
+def test_MHFDataset_multistep_slab(multistep_large_case):
+    """A time slice spanning several multi-step files is read in order across file boundaries."""
+    input_head_dir, output_head_dir = multistep_large_case
+    hf_collection = HFCollection(input_head_dir)
+    hf_groups = hf_collection.get_groups()
+
+    for group in hf_groups:
+        with MHFDataset(hf_groups[group]) as agg_hf_ds:
+            time_bnds = agg_hf_ds.get_var_vals("time_bounds", time_index_start=10, time_index_end=40)
+            expected = np.array([[t*30, (t+1)*30] for t in range(10, 40)])
+            assert np.array_equal(time_bnds, expected)
+
+
+def test_MHFDataset_out_buffer(multistep_large_case):
+    """get_var_vals() fills and returns a caller-supplied buffer with the same values as a fresh read."""
+    input_head_dir, output_head_dir = multistep_large_case
+    hf_collection = HFCollection(input_head_dir)
+    hf_groups = hf_collection.get_groups()
+
+    for group in hf_groups:
+        with MHFDataset(hf_groups[group]) as agg_hf_ds:
+            expected = agg_hf_ds.get_var_vals("VAR0", time_index_start=10, time_index_end=40)
+            buffer = np.empty(expected.shape, dtype=expected.dtype)
+            result = agg_hf_ds.get_var_vals("VAR0", time_index_start=10, time_index_end=40, out=buffer)
+            assert result is buffer
+            assert np.array_equal(buffer, expected)
+
+            with pytest.raises(ValueError):
+                agg_hf_ds.get_var_vals("VAR0", time_index_start=10, time_index_end=40, out=buffer[:-1])
+            with pytest.raises(ValueError):
+                agg_hf_ds.get_var_vals("VAR0", time_index_start=10, time_index_end=40, out=buffer.astype(np.float32))
+
+
+def test_MHFDataset_cached_attrs(simple_case):
+    """Variable and global attribute dictionaries are cached, and edits to a returned copy do not leak into later calls."""
+    input_head_dir, output_head_dir = simple_case
+    hf_collection = HFCollection(input_head_dir)
+    hf_groups = hf_collection.get_groups()
+
+    for group in hf_groups:
+        with MHFDataset(hf_groups[group]) as agg_hf_ds:
+            assert agg_hf_ds.get_var_attrs("VAR0")["long_name"] == "variable_0"
+            assert agg_hf_ds.get_global_attrs()["source"] == "GenTS testing suite"
+
+            var_attrs = agg_hf_ds.get_var_attrs("VAR0")
+            var_attrs["long_name"] = "edited"
+            global_attrs = agg_hf_ds.get_global_attrs()
+            global_attrs["history"] = "edited"
+            assert agg_hf_ds.get_var_attrs("VAR0")["long_name"] == "variable_0"
+            assert "history" not in agg_hf_ds.get_global_attrs()
+
+
+def test_MHFDataset_chunk_cache(tmp_path):
+    """Reading a chunked variable enlarges its chunk cache to hold at least two chunks."""
+    path = str(tmp_path / "chunked.nc")
+    with GenTSDataStore(path, "w") as ds:
+        ds.createDimension("time", None)
+        ds.createDimension("lat", 3)
+        ds.createVariable("time", "f8", ("time",))[:] = [15.0, 45.0]
+        ds.createVariable("VAR0", "f8", ("time", "lat"), chunksizes=(2, 3))[:] = np.ones((2, 3))
+
+    default_cache = nc.get_chunk_cache()
+    nc.set_chunk_cache(size=16)
+    try:
+        with MHFDataset([path]) as agg_hf_ds:
+            assert agg_hf_ds[0]["VAR0"].get_var_chunk_cache()[0] == 16
+            assert np.array_equal(agg_hf_ds.get_var_vals("VAR0", time_index_start=1), np.ones((1, 3)))
+            assert agg_hf_ds[0]["VAR0"].get_var_chunk_cache()[0] >= 2*2*3*8
+
+            # The cache is sized once per file and variable, not on every read
+            agg_hf_ds[0]["VAR0"].set_var_chunk_cache(size=32)
+            agg_hf_ds.get_var_vals("VAR0", time_index_end=1)
+            assert agg_hf_ds[0]["VAR0"].get_var_chunk_cache()[0] == 32
+    finally:
+        nc.set_chunk_cache(*default_cache)
+
+
 def test_MHFDataset_fragmented(spatial_fragment_case):
     """MHFDataset over a fragmented group reports the full combined spatial shape across all tiles."""
     input_head_dir, output_head_dir = spatial_fragment_case
@@ -46,6 +137,20 @@ def test_MHFDataset_fragmented(spatial_fragment_case):
             )
 
 
+def test_MHFDataset_fragmented_slices(spatial_fragment_case):
+    """Repeated time-slice reads of a fragmented group reuse tile placement and match a full read."""
+    input_head_dir, output_head_dir = spatial_fragment_case
+    hf_collection = HFCollection(input_head_dir)
+    hf_groups = hf_collection.get_groups()
+
+    for group in hf_groups:
+        with MHFDataset(hf_groups[group]) as agg_hf_ds:
+            full_vals = agg_hf_ds.get_var_vals("VAR0")
+            for start in range(FRAGMENTED_NUM_TIMESTEPS):
+                slice_vals = agg_hf_ds.get_var_vals("VAR0", time_index_start=start, time_index_end=start+1)
+                assert np.array_equal(slice_vals, full_vals[start:start+1])
+
+
 def test_get_concat_coords_simple(simple_case):
     """get_concat_coords() on a non-fragmented group returns coordinate values matching the first file and the correct time count."""
     input_head_dir, output_head_dir = simple_case
@@ -76,4 +181,22 @@ def test_get_concat_coords_fragmented(spatial_fragment_case):
             coords = get_concat_coords(agg_hf_ds)
             assert len(coords["lat"]) == FRAGMENTED_NUM_LAT_FILES*FRAGMENTED_NUM_LAT_PTS_PER_HF
             assert len(coords["lon"]) == FRAGMENTED_NUM_LON_FILES*FRAGMENTED_NUM_LON_PTS_PER_HF
-            assert len(coords["time"]) == FRAGMENTED_NUM_TIMESTEPS
\ No newline at end of file
+            assert len(coords["time"]) == FRAGMENTED_NUM_TIMESTEPS
+
+
+def test_MHFDataset_cached_shapes(simple_case):
+    """Cached dimensions and shapes are returned as fresh lists, so callers cannot corrupt the cache."""
+    input_head_dir, output_head_dir = simple_case
+    hf_collection = HFCollection(input_head_dir)
+    hf_groups = hf_collection.get_groups()
+
+    for group in hf_groups:
+        with MHFDataset(hf_groups[group]) as agg_hf_ds:
+            var_shape = agg_hf_ds.get_var_data_shape("VAR0")
+            var_dims = agg_hf_ds.get_var_dimensions("VAR0")
+            assert var_shape[0] == len(agg_hf_ds.get_time_vals())
+            var_shape[0] = -1
+            var_dims.append("bogus")
+            assert agg_hf_ds.get_var_data_shape("VAR0")[0] == len(agg_hf_ds.get_time_vals())
+            assert "bogus" not in agg_hf_ds.get_var_dimensions("VAR0")
+            assert list(agg_hf_ds.get_var_vals("VAR0").shape) == agg_hf_ds.get_var_data_shape("VAR0")
@@ -94,4 +94,23 @@ def test_dataset_opens(simple_case):
             assert mock_ds.call_count == 0
             ts_collection = TSCollection(hf_collection, output_head_dir, num_processes=1)
             ts_collection.execute(optimize=False) 
-            assert mock_ds.call_count == SIMPLE_NUM_TEST_HIST_FILES*SIMPLE_NUM_VARS
\ No newline at end of file
+            assert mock_ds.call_count == SIMPLE_NUM_TEST_HIST_FILES*SIMPLE_NUM_VARS
+
+
+class SerialThreadPoolExecutor(ThreadPoolExecutor):
+    """Runs submitted tasks one at a time, since netCDF4 handles are not thread-safe."""
+    def __init__(self, max_workers=None):
+        super().__init__(max_workers=1)
+
+
+def test_dataset_opens_balanced(simple_case):
+    """optimize=True splits a single group's variables into one batch per worker process."""
+    input_head_dir, output_head_dir = simple_case
+
+    hf_collection = HFCollection(input_head_dir, num_processes=1)
+    with patch("gents.timeseries.ProcessPoolExecutor", SerialThreadPoolExecutor):
+        with patch("gents.mhfdataset.GenTSDataStore", wraps=GenTSDataStore) as mock_ds:
+            ts_collection = TSCollection(hf_collection, output_head_dir, num_processes=NUM_PARALLEL_TASKS)
+            ts_paths = ts_collection.execute(optimize=True)
+            assert mock_ds.call_count == SIMPLE_NUM_TEST_HIST_FILES*NUM_PARALLEL_TASKS
+    assert len(ts_paths) == SIMPLE_NUM_VARS
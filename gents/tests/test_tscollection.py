@@ -7,6 +7,7 @@ from os import listdir, remove, makedirs
 from shutil import rmtree
 from cftime import num2date
 import warnings
+from unittest.mock import patch
 
 
 def clear_output_dir(output_dir):
@@ -129,6 +130,47 @@ def test_tscollection_copy(simple_case):
     assert ts_copy is not ts_collection
     
 
+def test_tscollection_copy_skips_sort(simple_case):
+    """Copies built from existing orders do not re-sort the HFCollection."""
+    input_head_dir, output_head_dir = simple_case
+    hf_collection = HFCollection(input_head_dir)
+    ts_collection = TSCollection(hf_collection, output_head_dir)
+
+    with patch.object(HFCollection, "sort_along_time") as mock_sort:
+        ts_copy = ts_collection.include("*", "VAR0").apply_overwrite("*")
+        assert mock_sort.call_count == 0
+    assert len(ts_copy) == 1
+
+
+def test_tscollection_modifiers_copy_orders(simple_case):
+    """Modifiers leave the source orders untouched while sharing their history file path lists."""
+    input_head_dir, output_head_dir = simple_case
+    hf_collection = HFCollection(input_head_dir)
+    ts_collection = TSCollection(hf_collection, output_head_dir)
+
+    ts_copy = ts_collection.apply_overwrite("*").apply_path_swap(str(output_head_dir), "/swapped")
+    for order, order_copy in zip(ts_collection, ts_copy):
+        assert "overwrite" not in order
+        assert order_copy["overwrite"]
+        assert order["ts_path_template"].startswith(str(output_head_dir))
+        assert order_copy["ts_path_template"].startswith("/swapped")
+        assert order_copy["hf_paths"] is order["hf_paths"]
+
+
+def test_tscollection_create_directories_once(structured_case):
+    """create_directories() creates each unique output directory exactly once."""
+    input_head_dir, output_head_dir = structured_case
+    hf_collection = HFCollection(input_head_dir)
+    ts_collection = TSCollection(hf_collection, output_head_dir)
+    directories = {Path(order["ts_path_template"]).parent for order in ts_collection}
+    assert len(directories) < len(ts_collection)
+
+    with patch("gents.timeseries.makedirs") as mock_makedirs:
+        ts_collection.create_directories()
+    assert mock_makedirs.call_count == len(directories)
+    assert {call.args[0] for call in mock_makedirs.call_args_list} == directories
+
+
 def test_tscollection_compression(simple_case):
     """Applying zlib compression at level 9 produces smaller output files than the uncompressed default."""
     input_head_dir, output_head_dir = simple_case
@@ -218,6 +260,18 @@ def test_ts_collection_path_swapping(structured_case):
             assert len(listdir(f"{output_head_dir}/{top_dir}/{sub_dir}")) == STRUCTURED_NUM_VARS
 
 
+def test_ts_collection_trailing_slash_input(structured_case):
+    """A trailing slash on the input directory does not change the output path templates."""
+    input_head_dir, output_head_dir = structured_case
+    ts_collection = TSCollection(HFCollection(input_head_dir), output_head_dir)
+    slash_collection = TSCollection(HFCollection(f"{input_head_dir}/"), output_head_dir)
+
+    templates = sorted(order["ts_path_template"] for order in ts_collection)
+    assert len(templates) > 0
+    assert templates == sorted(order["ts_path_template"] for order in slash_collection)
+    assert all(template.startswith(f"{output_head_dir}/") and "//" not in template for template in templates)
+
+
 def test_ts_collection_append_timestep_dirs(mixed_timestep_case):
     """append_timestep_dirs() creates hour_1, day_1, month_1, and year_1 subdirectories for mixed-frequency inputs."""
     input_head_dir, output_head_dir = mixed_timestep_case
@@ -237,6 +291,17 @@ def test_ts_collection_append_timestep_dirs(mixed_timestep_case):
     assert len(listdir(f"{output_head_dir}/year_1")) == SIMPLE_NUM_VARS
 
 
+def test_get_timestep_label():
+    """get_timestep_label() rounds time-step durations to hour/day/month/year labels and handles unknown steps."""
+    from datetime import timedelta
+
+    assert get_timestep_label(None) == "unsorted"
+    assert get_timestep_label(timedelta(hours=3)) == "hour_3"
+    assert get_timestep_label(timedelta(days=1)) == "day_1"
+    assert get_timestep_label(timedelta(days=30)) == "month_1"
+    assert get_timestep_label(timedelta(days=360)) == "year_1"
+
+
 def compare_timestr(hf_collection, ts_paths, timestep, time_format):
     with GenTSDataStore(list(hf_collection)[0], 'r') as hf_ds:
         units = hf_ds["time"].units
@@ -427,3 +492,38 @@ def test_tscollection_add_attrs(simple_case):
         with GenTSDataStore(path, 'r') as ts_ds:
             assert ts_ds.getncattr("gents_test_key") == "gents_test_val"
             assert ts_ds.getncattr("gents_test_key2") == "gents_test_val2"
+
+
+def test_generate_time_series_packed(tmp_path):
+    """Packed variables keep their storage dtype, packing attributes, and decoded values, including fill values."""
+    unpacked = np.array([[1.5, 2.25, -3.0], [4.0, -0.5, 7.75]])
+    hf_paths = []
+    for index in range(2):
+        path = str(tmp_path / f"packed.h0.000{index+1}-01.nc")
+        with GenTSDataStore(path, "w") as hf_ds:
+            hf_ds.createDimension("time", None)
+            hf_ds.createDimension("lat", 3)
+            time_var = hf_ds.createVariable("time", "f8", ("time",))
+            time_var.units = "days since 0001-01-01"
+            time_var.calendar = "noleap"
+            time_var[:] = [365.0*index]
+            packed_var = hf_ds.createVariable("VAR0", "i2", ("time", "lat"), fill_value=np.int16(-32767))
+            packed_var.scale_factor = 0.25
+            packed_var.add_offset = 1.0
+            packed_var[:] = np.ma.masked_array(unpacked[index:index+1], mask=[[False, index == 1, False]])
+        hf_paths.append(path)
+
+    ts_args = {"VAR0": {"ts_string": "test"}}
+    ts_path = generate_time_series(hf_paths, f"{tmp_path}/packed_ts.", ["time"], ts_args)[0]
+
+    with GenTSDataStore(ts_path, "r") as ts_ds:
+        assert ts_ds["VAR0"].dtype == np.int16
+        assert ts_ds["VAR0"].scale_factor == 0.25
+        assert ts_ds["VAR0"].add_offset == 1.0
+        assert ts_ds["VAR0"]._FillValue == -32767
+        ts_vals = ts_ds["VAR0"][:]
+        for index, path in enumerate(hf_paths):
+            with GenTSDataStore(path, "r") as hf_ds:
+                hf_vals = hf_ds["VAR0"][:]
+                assert np.array_equal(ts_vals.mask[index], np.ma.getmaskarray(hf_vals)[0])
+                assert np.ma.allequal(ts_vals[index], hf_vals[0])
@@ -17,6 +17,26 @@ def test_version():
     assert type(get_version()) == str
 
 
+def test_next_prime():
+    """next_prime() returns the smallest prime at or above the given value."""
+    assert next_prime(0) == 2
+    assert next_prime(2) == 2
+    assert next_prime(14) == 17
+    assert next_prime(1000) == 1009
+
+
+def test_get_relative_path(tmp_path):
+    """get_relative_path() tolerates trailing slashes and symlinked heads, and falls back to a string split."""
+    (tmp_path / "data" / "hist").mkdir(parents=True)
+    (tmp_path / "link").symlink_to(tmp_path / "data")
+
+    assert get_relative_path(f"{tmp_path}/data/hist/model.h0*", f"{tmp_path}/data/") == "hist/model.h0*"
+    assert get_relative_path(f"{tmp_path}/data//hist", f"{tmp_path}/data") == "hist"
+    assert get_relative_path(f"{tmp_path}/data/hist", f"{tmp_path}/link") == "hist"
+    assert get_relative_path(f"{tmp_path}/data", f"{tmp_path}/data/") == ""
+    assert get_relative_path("/data/hist/model.h0*", "data") == "hist/model.h0*"
+
+
 @pytest.fixture(scope="session")
 def log_output_dir(tmp_path_factory):
     """Session-scoped temp directory for log file output."""
@@ -7,18 +7,17 @@ Contact: cameron.cummins@utexas.edu
 Last Header Update: 01/31/25
 """
 import numpy as np
+import netCDF4 as nc
 import fnmatch
 from os.path import isfile
 from os import remove, makedirs
 from pathlib import Path
-from gents.meta import get_attributes
 from gents.mhfdataset import MHFDataset
 from gents.datastore import GenTSDataStore
-from gents.utils import get_version, LOG_LEVEL_IO_WARNING, ProgressBar
+from gents.utils import get_version, next_prime, get_relative_path, LOG_LEVEL_IO_WARNING, ProgressBar
 from concurrent.futures import ProcessPoolExecutor, as_completed
-import traceback
+from collections import defaultdict
 import logging
-import copy
 import warnings
 
 logger = logging.getLogger(__name__)
@@ -28,7 +27,8 @@ def check_timeseries_integrity(ts_path: str):
     Checks whether a time-series file was written completely by GenTS.
 
     Opens the file and looks for the ``gents_version`` global attribute, which
-    is stamped on every successfully completed output file.
+    is stamped on every successfully completed output file.  Only the attribute
+    names are listed; no attribute values or variable data are read.
 
     :param ts_path: Path to the time-series netCDF file to inspect.
     :type ts_path: str
@@ -38,8 +38,8 @@ def check_timeseries_integrity(ts_path: str):
     """
     try:
         with GenTSDataStore(ts_path, mode="r") as ts_ds:
-            attrs = get_attributes(ts_ds)
-        if "gents_version" in attrs:
+            complete = "gents_version" in ts_ds.ncattrs()
+        if complete:
             return True
     except OSError:
         logger.log(LOG_LEVEL_IO_WARNING, f"Corrupt timeseries output: '{ts_path}'")
@@ -94,9 +94,11 @@ def write_timeseries_file(agg_hf_ds, ts_out_path, primary_var, secondary_vars_da
 
     The primary variable is written with adaptive chunksizes: files smaller than
     4 MiB are stored contiguously; larger files are chunked along the time axis
-    to keep each chunk near 4 MiB.  Secondary variables are written with their
-    full shape as chunk sizes.  The global attributes are stamped with a
-    ``gents_version`` entry on completion.
+    to keep each chunk near 4 MiB.  The primary variable is copied in slabs of
+    whole chunks of up to 64 MiB each, read into a single reused buffer.
+    Secondary variables are written with their full shape as chunk sizes.  Fill
+    mode is disabled since every variable is written in full.  The global
+    attributes are stamped with a ``gents_version`` entry on completion.
 
     :param agg_hf_ds: Open :class:`~gents.mhfdataset.MHFDataset` providing
         aggregated data for the history file group.
@@ -145,6 +147,8 @@ def write_timeseries_file(agg_hf_ds, ts_out_path, primary_var, secondary_vars_da
         ts_start_index = 0
 
     with GenTSDataStore(ts_out_path, mode="w") as ts_ds:
+        # Every variable is written in full, so pre-filling storage with fill values is wasted I/O
+        ts_ds.set_fill_off()
         if primary_var != "auxiliary":
             var_shape = agg_hf_ds.get_var_data_shape(primary_var)
             var_dims = agg_hf_ds.get_var_dimensions(primary_var)
@@ -172,24 +176,21 @@ def write_timeseries_file(agg_hf_ds, ts_out_path, primary_var, secondary_vars_da
                                             complevel=complevel,
                                             compression=compression,
                                             chunksizes=chunksizes)
-            var_data.set_auto_mask(False)
-            var_data.set_auto_scale(False)
-            var_data.set_always_mask(False)
-            
-            ts_ds[primary_var].setncatts(agg_hf_ds.get_var_attrs(primary_var))
+            var_data.setncatts(agg_hf_ds.get_var_attrs(primary_var))
+            primary_shape, primary_dims = var_shape, var_dims
 
-            if len(var_shape) > 0 and "time" in var_dims:
-                for i in range(0, var_shape[0], chunksizes[0]):
-                    end = min(i + chunksizes[0], var_shape[0])
-                    var_data[i:end] = agg_hf_ds.get_var_vals(
-                        primary_var, time_index_start=ts_start_index+i, time_index_end=ts_start_index+end
-                    )
-            else:
-                var_data[:] = agg_hf_ds.get_var_vals(primary_var)[ts_start_index:ts_end_index]
+            # Each slab fills whole chunks exactly once, so evict fully written chunks first
+            cache_size, cache_nelems, _ = nc.get_chunk_cache()
+            chunk_nbytes = int(np.prod(chunksizes)) * var_dtype.itemsize
+            var_data.set_var_chunk_cache(size=max(cache_size, 2*chunk_nbytes),
+                                         nelems=next_prime(cache_nelems),
+                                         preemption=1.0)
 
+        secondary_var_dims = {}
         for secondary_var in secondary_vars_data:
             var_shape = agg_hf_ds.get_var_data_shape(secondary_var)
             var_dims = agg_hf_ds.get_var_dimensions(secondary_var)
+            secondary_var_dims[secondary_var] = var_dims
 
             if ts_end_index is None:
                 ts_end_index = var_shape[0]
@@ -209,16 +210,30 @@ def write_timeseries_file(agg_hf_ds, ts_out_path, primary_var, secondary_vars_da
                                             complevel=complevel,
                                             compression=compression,
                                             chunksizes=var_shape)
-            
-            svar_data.set_auto_mask(False)
-            svar_data.set_auto_scale(False)
-            svar_data.set_always_mask(False)
+            svar_data.setncatts(agg_hf_ds.get_var_attrs(secondary_var))
 
-            ts_ds[secondary_var].setncatts(agg_hf_ds.get_var_attrs(secondary_var))
-            if "time" in var_dims:
-                svar_data[:] = secondary_vars_data[secondary_var][ts_start_index:ts_end_index]
+        # Values are copied raw (packed and unmasked), so disable masking and scaling for every variable at once
+        ts_ds.set_auto_maskandscale(False)
+
+        if primary_var != "auxiliary":
+            if len(primary_shape) > 0 and "time" in primary_dims:
+                # Read and write as many whole chunks per slab as fit in 64 MiB
+                slab_size = chunksizes[0] * max(1, 64*(1024**2) // chunk_nbytes)
+                slab_buffer = np.empty([min(slab_size, primary_shape[0])] + list(primary_shape[1:]), dtype=var_dtype)
+                for i in range(0, primary_shape[0], slab_size):
+                    end = min(i + slab_size, primary_shape[0])
+                    var_data[i:end] = agg_hf_ds.get_var_vals(
+                        primary_var, time_index_start=ts_start_index+i, time_index_end=ts_start_index+end,
+                        out=slab_buffer[:end-i]
+                    )
+            else:
+                var_data[:] = agg_hf_ds.get_var_vals(primary_var)[ts_start_index:ts_end_index]
+
+        for secondary_var in secondary_vars_data:
+            if "time" in secondary_var_dims[secondary_var]:
+                ts_ds[secondary_var][:] = secondary_vars_data[secondary_var][ts_start_index:ts_end_index]
             else:
-                svar_data[:] = secondary_vars_data[secondary_var]
+                ts_ds[secondary_var][:] = secondary_vars_data[secondary_var]
         
         if append_attrs is None:
             append_attrs = {}
@@ -226,7 +241,7 @@ def write_timeseries_file(agg_hf_ds, ts_out_path, primary_var, secondary_vars_da
     return ts_out_path
 
 
-def generate_time_series(hf_paths, ts_path_template, secondary_vars, ts_args):
+def generate_time_series(hf_paths, ts_path_template, secondary_vars, ts_args, in_memory=False):
     """
     Generates time-series files for a group of history files.
 
@@ -247,21 +262,23 @@ def generate_time_series(hf_paths, ts_path_template, secondary_vars, ts_args):
         keyword arguments for :func:`write_timeseries_file` (must include a
         ``'ts_string'`` key for the timestamp suffix).
     :type ts_args: dict
+    :param in_memory: If ``True``, history files are read fully into memory when
+        opened. Defaults to ``False``.
+    :type in_memory: bool
     :returns: List of paths to the generated time-series files.
     :rtype: list[str]
     """
     ts_paths = []
-    with MHFDataset(hf_paths) as agg_hf_ds:
+    with MHFDataset(hf_paths, in_memory=in_memory) as agg_hf_ds:
         secondary_vars_data = {}
         
         for variable in secondary_vars:
             secondary_vars_data[variable] = agg_hf_ds.get_var_vals(variable)
         
         for variable in ts_args:
-            args = copy.deepcopy(ts_args[variable])
-            ts_string = args["ts_string"]
+            args = dict(ts_args[variable])
+            ts_string = args.pop("ts_string")
             ts_out_path = f"{ts_path_template}.{variable}.{ts_string}.nc"
-            del args["ts_string"]
 
             ts_paths.append(write_timeseries_file(
                 agg_hf_ds=agg_hf_ds,
@@ -311,6 +328,35 @@ def get_timestamp_format(dt, subhour_format="%Y%m%d%H%M%S", hourly_format="%Y%m%
     return time_format
 
 
+def get_timestep_label(dt):
+    """
+    Returns the frequency directory label for a given time-step duration.
+
+    The duration is rounded to the nearest whole number of hours, days, months
+    (30 days), or years (12 months) and formatted as ``'hour_N'``, ``'day_N'``,
+    ``'month_N'``, or ``'year_N'``.
+
+    :param dt: Duration of a single model time step, or ``None`` if unknown.
+    :type dt: datetime.timedelta or None
+    :returns: Frequency label, or ``'unsorted'`` if ``dt`` is ``None``.
+    :rtype: str
+    """
+    if dt is None:
+        return "unsorted"
+
+    hours = np.rint(dt.total_seconds() / 60.0 / 60.0)
+    days = np.rint(hours / 24.0)
+    months = np.rint(days / 30)
+    years = np.rint(months / 12)
+    if hours < 24:
+        return f"hour_{int(hours)}"
+    elif days < 28:
+        return f"day_{int(days)}"
+    elif months < 12:
+        return f"month_{int(months)}"
+    return f"year_{int(years)}"
+
+
 class TSCollection:
     """
     Manages the set of time-series generation orders derived from an ``HFCollection``.
@@ -319,7 +365,9 @@ class TSCollection:
     paths, output path template, primary variable name, secondary variable names,
     and generation arguments (compression, overwrite flag, etc.).  All modifier
     methods return new ``TSCollection`` instances, preserving an immutable-style
-    fluent API.
+    fluent API.  Modifiers copy each order dictionary shallowly, so values such as
+    the ``hf_paths`` list are shared between collections and must be treated as
+    read-only.
     """
 
     def __init__(self, hf_collection, output_dir, ts_orders=None, num_processes=None, dask_client=None):
@@ -345,7 +393,8 @@ class TSCollection:
         :param output_dir: Root directory to write time-series output files to.
         :type output_dir: str
         :param ts_orders: Pre-built list of order dictionaries. When supplied,
-            order construction is skipped. Defaults to ``None``.
+            order construction (including the time sort of ``hf_collection``) is
+            skipped. Defaults to ``None``.
         :type ts_orders: list or None
         :param num_processes: Maximum number of worker processes for parallel
             execution. Defaults to ``None`` (single process).
@@ -359,13 +408,11 @@ class TSCollection:
         if num_processes is not None:
             self.__num_processes = num_processes
         
-        hf_collection = hf_collection.sort_along_time()
-
         self.__hf_collection = hf_collection
-        self.__groups = self.__hf_collection.get_groups()
         self.__output_dir = output_dir
         
         if ts_orders is None:
+            self.__hf_collection = hf_collection.sort_along_time()
             self.__orders = list(self.update_ts_orders())
             logger.debug(f"TSCollection initialized at '{self.__output_dir}'.")
             logger.debug(f"{len(self.__orders)} timeseries orders generated.")
@@ -439,29 +486,33 @@ class TSCollection:
             accepted values.
         """
         self.__hf_collection.check_pulled()
+        hf_groups = self.__hf_collection.get_groups()
+        input_dir = str(self.__hf_collection.get_input_dir())
         orders = []
-        for index, glob_template in enumerate(self.__groups):
-            hf_paths = self.__groups[glob_template]
-            output_template = glob_template.split(str(self.__hf_collection.get_input_dir()))[1]
+        for index, glob_template in enumerate(hf_groups):
+            hf_paths = hf_groups[glob_template]
+            output_template = "/" + get_relative_path(glob_template, input_dir)
             if "[sorting_pivot]" in output_template:
                 output_template, slice_years = output_template.split("[sorting_pivot]")
-                logger.debug(f"Group [{index+1}/{len(self.__groups)}] {len(hf_paths)} files: {output_template}, sliced to [{slice_years}]")
+                logger.debug(f"Group [{index+1}/{len(hf_groups)}] {len(hf_paths)} files: {output_template}, sliced to [{slice_years}]")
             else:
-                logger.debug(f"Group [{index+1}/{len(self.__groups)}] {len(hf_paths)} files: {output_template}")
+                logger.debug(f"Group [{index+1}/{len(hf_groups)}] {len(hf_paths)} files: {output_template}")
             ts_path_template = f"{self.__output_dir}{output_template}"
 
-            primary_vars = self.__hf_collection[hf_paths[0]].get_primary_variables()
-            secondary_vars = self.__hf_collection[hf_paths[0]].get_secondary_variables()
+            init_meta = self.__hf_collection[hf_paths[0]]
+            primary_vars = init_meta.get_primary_variables()
+            secondary_vars = init_meta.get_secondary_variables()
             time_format = get_timestamp_format(self.__hf_collection.get_timestep_delta(hf_paths[0]), **strfrmt_kwargs)
             
             times = []
             sliced_times = []
             unsliced_times = []
             for path in hf_paths:
+                meta = self.__hf_collection[path]
                 time_slice_bounds = self.__hf_collection.get_multistep_slices(path)
-                time_bnds = self.__hf_collection[path].get_cftime_bounds()
-                time_cfvals = self.__hf_collection[path].get_cftimes()
-                unsliced_times.append(copy.deepcopy(time_cfvals))
+                time_bnds = meta.get_cftime_bounds()
+                time_cfvals = meta.get_cftimes()
+                unsliced_times.append(time_cfvals)
 
                 if time_slice_bounds is not None:
                     time_slice_bounds = time_slice_bounds[slice_years]
@@ -470,19 +521,18 @@ class TSCollection:
                         time_bnds = time_bnds[time_slice_bounds[0]:time_slice_bounds[1]]
                 sliced_times.append(time_cfvals)
 
-                hf_times = []
                 if time_bnds is None or time_alignment_method == "direct_time":
                     hf_times = time_cfvals
                 else:
-                    for ts in time_bnds:
-                        if time_alignment_method == "midpoint":
-                            hf_times.append(ts[0] + (ts[1] - ts[0]) / 2)
-                        elif time_alignment_method == "start_bound":
-                            hf_times.append(ts[0])
-                        elif time_alignment_method == "end_bound":
-                            hf_times.append(ts[1])
-                        else:
-                            raise ValueError(f"'{time_alignment_method}' is an invalid time-alignment method. Valid methods are ['direct_time', 'midpoint', 'start_bound', 'end_bound']")
+                    time_bnds = np.reshape(np.asarray(time_bnds), (-1, 2))
+                    if time_alignment_method == "midpoint":
+                        hf_times = time_bnds[:, 0] + (time_bnds[:, 1] - time_bnds[:, 0]) / 2
+                    elif time_alignment_method == "start_bound":
+                        hf_times = time_bnds[:, 0]
+                    elif time_alignment_method == "end_bound":
+                        hf_times = time_bnds[:, 1]
+                    else:
+                        raise ValueError(f"'{time_alignment_method}' is an invalid time-alignment method. Valid methods are ['direct_time', 'midpoint', 'start_bound', 'end_bound']")
                 times.append(hf_times)
             times = np.concatenate(times)
             start_time = min(times)
@@ -574,7 +624,7 @@ class TSCollection:
         :rtype: TSCollection
         """
         filtered_orders = []
-        for order_dict in copy.deepcopy(self.__orders):
+        for order_dict in map(dict, self.__orders):
             path_matched = False
             for path in order_dict["hf_paths"]:
                 if fnmatch.fnmatch(path, path_glob):
@@ -602,7 +652,7 @@ class TSCollection:
         :rtype: TSCollection
         """
         filtered_orders = []
-        for order_dict in copy.deepcopy(self.__orders):
+        for order_dict in map(dict, self.__orders):
             path_unmatched = True
             for path in order_dict["hf_paths"]:
                 if fnmatch.fnmatch(path, path_glob):
@@ -638,7 +688,7 @@ class TSCollection:
         :rtype: TSCollection
         """
         new_orders = []
-        for order_dict in copy.deepcopy(self.__orders):
+        for order_dict in map(dict, self.__orders):
             path_matched = False
             for path in order_dict["hf_paths"]:
                 if fnmatch.fnmatch(path, path_glob):
@@ -680,7 +730,7 @@ class TSCollection:
         :rtype: TSCollection
         """
         new_orders = []
-        for order_dict in copy.deepcopy(self.__orders):
+        for order_dict in map(dict, self.__orders):
             for path in order_dict["hf_paths"]:
                 if fnmatch.fnmatch(path, path_glob):
                     order_dict["ts_path_template"] = order_dict["ts_path_template"].replace(string_match, string_swap)
@@ -729,7 +779,8 @@ class TSCollection:
         """
         Inserts a time-step frequency subdirectory into each matching order's output path.
 
-        Determines the frequency label from the group's timestep delta:
+        Determines the frequency label from the group's timestep delta via
+        :func:`get_timestep_label` (computed once per history file group):
         ``'hour_N'``, ``'day_N'``, ``'month_N'``, or ``'year_N'``.  The label is
         inserted as a new directory level immediately before the filename in the
         output path template, organising outputs by observation frequency.
@@ -741,25 +792,14 @@ class TSCollection:
         :rtype: TSCollection
         """
         new_orders = []
-        for order_dict in copy.deepcopy(self.__orders):
+        timestep_labels = {}
+        for order_dict in map(dict, self.__orders):
             if fnmatch.fnmatch(order_dict["primary_var"], var_glob):
-                dt = self.__hf_collection.get_timestep_delta(order_dict["hf_paths"][0])
-
-                if dt is None:
-                    timestep_label = "unsorted"
-                else:
-                    hours = np.rint(dt.total_seconds() / 60.0 / 60.0)
-                    days = np.rint(hours / 24.0)
-                    months = np.rint(days / 30)
-                    years = np.rint(months / 12)
-                    if hours < 24:
-                        timestep_label = f"hour_{int(hours)}"
-                    elif days < 28:
-                        timestep_label = f"day_{int(days)}"
-                    elif months < 12:
-                        timestep_label = f"month_{int(months)}"
-                    else:
-                        timestep_label = f"year_{int(years)}"
+                first_hf_path = order_dict["hf_paths"][0]
+                if first_hf_path not in timestep_labels:
+                    dt = self.__hf_collection.get_timestep_delta(first_hf_path)
+                    timestep_labels[first_hf_path] = get_timestep_label(dt)
+                timestep_label = timestep_labels[first_hf_path]
 
                 template = Path(order_dict["ts_path_template"])
                 order_dict["ts_path_template"] = str(template.parent) + f"/{timestep_label}/" + template.name
@@ -787,15 +827,20 @@ class TSCollection:
         """
         Creates the output directory tree for all time-series orders.
 
+        Orders for the same history file group share an output directory, so
+        the unique parent directories are collected first and each is created
+        once.
+
         :param exist_ok: If ``True`` (default), no error is raised when a
             directory already exists.
         :type exist_ok: bool
         """
         logger.info("Creating directory structure for time series output.")
-        for order_dict in self.__orders:
-            makedirs(Path(order_dict['ts_path_template']).parent, exist_ok=exist_ok)
+        templates = {order_dict['ts_path_template'] for order_dict in self.__orders}
+        for directory in {Path(template).parent for template in templates}:
+            makedirs(directory, exist_ok=exist_ok)
 
-    def execute(self, optimize=True, optimize_batch_n=200, raise_errors=False):
+    def execute(self, optimize=True, optimize_batch_n=200, raise_errors=False, in_memory=False):
         """
         Executes all time-series generation orders in parallel.
 
@@ -803,7 +848,9 @@ class TSCollection:
         file are batched together (up to ``optimize_batch_n`` per batch) so that
         :func:`generate_time_series` opens each group of history files only once
         and writes multiple primary-variable output files per worker invocation,
-        significantly reducing file I/O overhead.
+        significantly reducing file I/O overhead. Batches are also capped at an
+        even share of all orders per worker process so that a collection with
+        few groups still occupies every worker.
 
         When ``optimize=False``, each order is submitted as a separate worker task
         (one file open per variable).
@@ -817,29 +864,35 @@ class TSCollection:
         :param raise_errors: If ``True`` (default ``False``), calls errors are raised
             rather than just logged.
         :type raise_errors: bool
+        :param in_memory: If ``True`` (default ``False``), each worker reads its
+            history files fully into memory on open instead of slab-by-slab from
+            disk. Faster on local storage when a group fits in worker memory.
+        :type in_memory: bool
         :returns: List of paths to all generated time-series output files.
         :rtype: list[str]
         """
         self.create_directories()
-        results = []
+        output_paths = []
 
+        # Per-variable arguments are everything except the group-level keys; copying just those
+        # avoids deep-copying each order's full list of history file paths
+        group_keys = ("hf_paths", "ts_path_template", "secondary_vars", "primary_var")
         optimized_orders = []
         if optimize:
-            order_index_merge_map = {}
+            order_index_merge_map = defaultdict(list)
             for index, order in enumerate(self.__orders):
                 first_hf_path = order["hf_paths"][0]
                 start_index = order["ts_start_index"]
                 end_index = order["ts_end_index"]
-                key = f"{first_hf_path}.{start_index}.{end_index}"
-                if key in order_index_merge_map:
-                    order_index_merge_map[key].append(index)
-                else:
-                    order_index_merge_map[key] = [index]
+                order_index_merge_map[f"{first_hf_path}.{start_index}.{end_index}"].append(index)
             
+            worker_share = int(np.ceil(len(self.__orders) / self.__num_processes))
+            batch_n = max(1, min(optimize_batch_n, worker_share))
+
             batched_index_lists = []
             for key in order_index_merge_map:
                 indices = order_index_merge_map[key]
-                chunked_indices = [indices[i:i+optimize_batch_n] for i in range(0, len(indices), optimize_batch_n)]
+                chunked_indices = [indices[i:i+batch_n] for i in range(0, len(indices), batch_n)]
                 for index_list in chunked_indices:
                     batched_index_lists.append(index_list)
             for index_list in batched_index_lists:
@@ -848,40 +901,32 @@ class TSCollection:
                 ts_args = {}
 
                 for index in index_list:
-                    primary_var = self.__orders[index]["primary_var"]
-                    args = copy.deepcopy(self.__orders[index])
-                    del args["hf_paths"]
-                    del args["ts_path_template"]
-                    del args["secondary_vars"]
-                    del args["primary_var"]
-                    ts_args[primary_var] = args
+                    order = self.__orders[index]
+                    ts_args[order["primary_var"]] = {key: order[key] for key in order if key not in group_keys}
 
                 optimized_orders.append({
                     "hf_paths": init_order["hf_paths"],
                     "ts_path_template": init_order["ts_path_template"],
                     "secondary_vars": init_order["secondary_vars"],
-                    "ts_args": ts_args
+                    "ts_args": ts_args,
+                    "in_memory": in_memory
                 })
         else:
-            for index, order in enumerate(self.__orders):
-                args = copy.deepcopy(order)
-                del args["hf_paths"]
-                del args["ts_path_template"]
-                del args["secondary_vars"]
-                del args["primary_var"]
-                ts_args = {order["primary_var"]: args}
+            for order in self.__orders:
+                ts_args = {order["primary_var"]: {key: order[key] for key in order if key not in group_keys}}
                 optimized_orders.append({
                     "hf_paths": order["hf_paths"],
                     "ts_path_template": order["ts_path_template"],
                     "secondary_vars": order["secondary_vars"],
-                    "ts_args": ts_args
+                    "ts_args": ts_args,
+                    "in_memory": in_memory
                 })
         with ProcessPoolExecutor(max_workers=self.__num_processes) as executor:
             futures = {executor.submit(generate_time_series, **args): args for args in optimized_orders}
             prog_bar = ProgressBar(total=len(futures), label="Generating Timeseries")
             for future in as_completed(futures):
                 try:
-                    results.append(future.result())
+                    output_paths.extend(future.result())
                 except Exception as exc:
                     path = futures[future]
                     logger.warning(f"Failed to generate time series for {path}: {exc}", exc_info=True)
@@ -889,11 +934,6 @@ class TSCollection:
                         raise
                 finally:
                     prog_bar.step()
-        
-        output_paths = []
-        for result in results:
-            for path in result:
-                output_paths.append(path)
 
         return output_paths
 
@@ -907,7 +947,7 @@ class TSCollection:
         :rtype: TSCollection
         """
         new_orders = []
-        for order_dict in copy.deepcopy(self.__orders):
+        for order_dict in map(dict, self.__orders):
             order_dict["append_attrs"] = attrs
             new_orders.append(order_dict)
         return self.copy(ts_orders=new_orders)
\ No newline at end of file
@@ -12,6 +12,7 @@ import logging
 import sys
 import datetime
 import numpy as np
+from pathlib import Path
 
 LOG_LEVEL_IO_WARNING = 5
 
@@ -36,6 +37,49 @@ def get_version():
     return version('gents')
 
 
+def next_prime(value):
+    """
+    Returns the smallest prime number greater than or equal to ``value``.
+
+    Used to size HDF5 chunk cache hash tables, which perform best with a prime
+    number of slots.
+
+    :param value: Lower bound for the prime search.
+    :type value: int
+    :returns: Smallest prime ``>= value`` (at least ``2``).
+    :rtype: int
+    """
+    candidate = max(2, int(value))
+    while True:
+        if all(candidate % divisor != 0 for divisor in range(2, int(candidate**0.5) + 1)):
+            return candidate
+        candidate += 1
+
+
+def get_relative_path(path, head_dir):
+    """
+    Returns the portion of ``path`` below ``head_dir``.
+
+    Both sides are resolved first, so trailing slashes, redundant separators,
+    and symlinked head directories do not prevent a match.  If ``path`` is
+    still not under ``head_dir``, falls back to the text following the last
+    occurrence of ``head_dir`` in ``path``.
+
+    :param path: Path (or glob template) to make relative.
+    :type path: str or pathlib.Path
+    :param head_dir: Head directory to strip from ``path``.
+    :type head_dir: str or pathlib.Path
+    :returns: Relative path without a leading separator (``''`` if ``path``
+        is ``head_dir`` itself).
+    :rtype: str
+    """
+    try:
+        relative_path = Path(path).resolve().relative_to(Path(head_dir).resolve())
+        return "" if relative_path == Path(".") else str(relative_path)
+    except ValueError:
+        return str(path).split(str(head_dir))[-1].lstrip("/")
+
+
 def enable_logging(verbose=False, output_path=None):
     """
     Configures the ``gents`` package logger and begins emitting log messages.